@@ -9,6 +9,7 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import os
 from pathlib import Path
 
 # from src.dataset.merger import merge_snapshot_labels
@@ -17,6 +18,10 @@ from pathlib import Path
 # from src.utils.config import load_config
 # from src.utils.logger import get_logger
 
+_LABELS_DIR = "data/labels"
+_COHORT_PREFIX = "cohort_"
+_LABEL_SUFFIX = ".jsonl"
+
 
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Build train-ready dataset")
@@ -46,20 +51,43 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
+def _discover_cohorts(labels_dir: str = _LABELS_DIR) -> list[str]:
+    """Return sorted cohort IDs that have a ``cohort_{id}.jsonl`` label file.
+
+    Uses ``os.scandir`` so the file type comes from the directory entry
+    itself — no per-file ``stat()`` and no ``Path`` objects.
+    """
+    try:
+        with os.scandir(labels_dir) as it:
+            cohorts = [
+                e.name[len(_COHORT_PREFIX) : -len(_LABEL_SUFFIX)]
+                for e in it
+                if e.name.startswith(_COHORT_PREFIX)
+                and e.name.endswith(_LABEL_SUFFIX)
+                and e.is_file(follow_symlinks=False)
+            ]
+    except FileNotFoundError:
+        return []
+    return sorted(cohorts)
+
+
 def main(argv: list[str] | None = None) -> None:
     args = parse_args(argv)
 
+    cohort_ids = args.cohort_ids or _discover_cohorts()
+
     print(f"[build_dataset] config     : {args.config}")
-    print(f"[build_dataset] cohort_ids : {args.cohort_ids or 'all'}")
+    print(f"[build_dataset] cohort_ids : {cohort_ids or 'none found'}")
     print(f"[build_dataset] output_dir : {args.output_dir}")
 
     # ── Pipeline skeleton ──────────────────────────────────────────────
     # config = load_config(args.config)
     # logger = get_logger("build_dataset")
     #
-    # 1. Discover cohorts (from args or scan data/labels/)
+    # 1. Discover cohorts (from args or scan data/labels/) — done above
     # 2. For each cohort:
     #    a. Load raw_snapshots/cohort_{id}/listings.jsonl
+    #       (scrape metadata: prefer meta.json, fall back to meta.yaml)
     #    b. Load raw_snapshots/cohort_{id}/sellers.jsonl
     #    c. Load labels/cohort_{id}.jsonl
     #    d. Merge → interim/merged_{id}.parquet
@@ -2,7 +2,7 @@
 Pipeline entrypoint: Evaluate best model on held-out test set.
 
 Usage:
-    python -m src.pipelines.evaluate --model-path artifacts/models/xgboost.pkl
+    python -m src.pipelines.evaluate --model-path artifacts/models/xgboost.ubj
     python -m src.pipelines.evaluate --best
 """
 
@@ -30,7 +30,7 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         "--model-path",
         type=str,
         default=None,
-        help="Path to a specific model artifact (.pkl / .cbm)",
+        help="Path to a specific model artifact (.pkl / .ubj / .cbm)",
     )
     parser.add_argument(
         "--best",
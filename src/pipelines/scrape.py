@@ -17,24 +17,36 @@ Usage::
 
 The pipeline:
     1. Loads ``configs/scraping.yaml``
-    2. For each target category, crawls listing URLs
+    2. For each target category (concurrently, bounded by
+       ``max_concurrency``), crawls listing URLs
     3. Scrapes individual listing detail pages
-    4. Saves results as JSONL files + ``meta.yaml``
+    4. Saves results as JSONL files + ``meta.json`` (machine-read) and
+       ``meta.yaml`` (human-readable copy)
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
 import sys
 from datetime import datetime
 from pathlib import Path
 
-import yaml
+try:
+    import orjson
+except ImportError:  # pragma: no cover — optional speed-up
+    orjson = None
 
-from src.scraping.scraper import DolapScraper, load_scraping_config
+from src.utils.config import load_config
 from src.utils.logger import get_logger, setup_logging
 
+# yaml and the Selenium scraper are imported once we know we will scrape,
+# so ``--help`` / ``--dry-run`` stay fast.
+
+# Cost estimate for categories without history: one full page per page
+_LISTINGS_PER_PAGE_ESTIMATE = 24
+
 
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Scrape Dolap.com listings")
@@ -73,6 +85,11 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         action="store_true",
         help="Run browser with visible window (for debugging)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore the on-disk HTML cache and always fetch pages",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -81,6 +98,112 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
+def _try_load_prior_meta(snapshots_dir: Path, current: Path) -> dict[str, dict]:
+    """Return ``categories`` stats from the newest earlier cohort, or ``{}``.
+
+    Reads ``meta.json`` when present and falls back to ``meta.yaml``; any
+    unreadable or missing file simply means "no history".
+    """
+    if not snapshots_dir.is_dir():
+        return {}
+
+    # Only cohorts named before *current* count as history — re-scraping an
+    # older cohort id must not schedule from a later cohort's stats
+    cohorts = sorted(
+        (
+            p
+            for p in snapshots_dir.glob("cohort_*")
+            if p.is_dir() and p.name < current.name
+        ),
+        reverse=True,
+    )
+    for cohort_dir in cohorts:
+        try:
+            json_path = cohort_dir / "meta.json"
+            if json_path.is_file():
+                meta = json.loads(json_path.read_bytes())
+            elif (cohort_dir / "meta.yaml").is_file():
+                import yaml
+
+                with open(cohort_dir / "meta.yaml", encoding="utf-8") as fh:
+                    meta = yaml.safe_load(fh) or {}
+            else:
+                continue
+        except Exception:  # unreadable / corrupt metadata → try an older cohort
+            continue
+        categories = meta.get("categories")
+        if isinstance(categories, dict):
+            return categories
+    return {}
+
+
+def _schedule_longest_first(
+    categories: list[str],
+    prior_meta: dict[str, dict],
+    max_pages: int,
+) -> list[tuple[str, int]]:
+    """Order *categories* by estimated cost, largest first (LPT scheduling).
+
+    The estimate is the category's listing count in the previous cohort,
+    or ``max_pages`` full pages when it has no usable history (no entry, or
+    a hand-edited / older meta file holding a non-mapping value).  Starting
+    the long categories first keeps one straggler from dominating the
+    makespan.
+    """
+    default = max_pages * _LISTINGS_PER_PAGE_ESTIMATE
+    estimates = {}
+    for slug in categories:
+        entry = prior_meta.get(slug)
+        if not isinstance(entry, dict):
+            entry = {}
+        estimates[slug] = int(entry.get("listings_scraped", default))
+    return sorted(estimates.items(), key=lambda item: -item[1])
+
+
+async def _scrape_categories(
+    categories: list[str],
+    *,
+    config_path: str,
+    headless: bool,
+    max_pages: int,
+    output_dir: Path,
+    max_concurrency: int,
+    cache_enabled: bool | None = None,
+) -> list[tuple[str, Path, int]]:
+    """Scrape *categories* concurrently, at most *max_concurrency* at a time.
+
+    Scraping is I/O-bound (network + browser round trips), so categories are
+    dispatched to worker threads.  A Selenium driver is not thread-safe, hence
+    every category gets its own ``DolapScraper`` (and browser).
+
+    Returns ``(slug, jsonl_path, listings_scraped)`` tuples in input order.
+    """
+    from src.scraping.scraper import DolapScraper
+
+    logger = get_logger("pipeline.scrape")
+    sem = asyncio.Semaphore(max_concurrency)
+
+    def _scrape_one(slug: str) -> tuple[str, Path, int]:
+        jsonl_path = output_dir / f"{slug}.jsonl"
+        with DolapScraper(
+            config_path=config_path, headless=headless, cache_enabled=cache_enabled
+        ) as scraper:
+            n_listings = scraper.scrape_category(
+                category_slug=slug,
+                max_pages=max_pages,
+                output_path=jsonl_path,
+            )
+        logger.info("Category complete", category=slug, listings=n_listings)
+        return slug, jsonl_path, n_listings
+
+    async def _run(slug: str) -> tuple[str, Path, int]:
+        async with sem:
+            logger.info("Category started", category=slug)
+            return await asyncio.to_thread(_scrape_one, slug)
+
+    return list(await asyncio.gather(*(_run(slug) for slug in categories)))
+
+
 def main(argv: list[str] | None = None) -> None:
     args = parse_args(argv)
 
@@ -88,7 +211,9 @@ def main(argv: list[str] | None = None) -> None:
     setup_logging(level="INFO")
     logger = get_logger("pipeline.scrape")
 
-    cfg = load_scraping_config(args.config)
+    # Same lookup as scraper.load_scraping_config, without importing Selenium
+    cfg = load_config(args.config)
+    cfg = cfg.get("scraping", cfg)
     cohort_id = args.cohort_id or datetime.now().strftime("%Y%m%d")
     output_dir = Path(cfg.get("output_dir", "data/raw_snapshots")) / f"cohort_{cohort_id}"
     headless = not args.no_headless
@@ -121,40 +246,50 @@ def main(argv: list[str] | None = None) -> None:
         return
 
     # ── Execute ────────────────────────────────────────────────────────
+    import yaml
+
     output_dir.mkdir(parents=True, exist_ok=True)
     scrape_start = datetime.utcnow()
 
-    total_listings: int = 0
-    category_stats: dict[str, dict] = {}
-
-    with DolapScraper(config_path=args.config, headless=headless) as scraper:
-        for slug in categories:
-            logger.info(f"{'─' * 40}")
-            logger.info(f"Category: {slug}")
-
-            jsonl_path = output_dir / f"{slug}.jsonl"
+    max_concurrency = max(1, int(cfg.get("max_concurrency", 4)))
+    schedule = _schedule_longest_first(
+        categories,
+        _try_load_prior_meta(output_dir.parent, output_dir),
+        max_pages,
+    )
+    categories = [slug for slug, _ in schedule]
+    logger.info(
+        "Dispatching categories",
+        categories=len(categories),
+        max_concurrency=max_concurrency,
+        schedule=schedule,
+    )
 
-            results = scraper.scrape_category(
-                category_slug=slug,
-                max_pages=max_pages,
-                output_path=jsonl_path,
-            )
+    results = asyncio.run(
+        _scrape_categories(
+            categories,
+            config_path=args.config,
+            headless=headless,
+            max_pages=max_pages,
+            output_dir=output_dir,
+            max_concurrency=max_concurrency,
+            cache_enabled=False if args.no_cache else None,
+        )
+    )
 
-            category_stats[slug] = {
-                "listings_scraped": len(results),
-                "output_file": str(jsonl_path),
-            }
-            total_listings += len(results)
+    total_listings: int = 0
+    category_stats: dict[str, dict] = {}
 
-            logger.info(
-                "Category complete",
-                category=slug,
-                listings=len(results),
-            )
+    for slug, jsonl_path, n_listings in results:
+        category_stats[slug] = {
+            "listings_scraped": n_listings,
+            "output_file": str(jsonl_path),
+        }
+        total_listings += n_listings
 
     scrape_end = datetime.utcnow()
 
-    # ── Write meta.yaml ────────────────────────────────────────────────
+    # ── Write meta.json + meta.yaml ────────────────────────────────────
     meta = {
         "cohort_id": cohort_id,
         "scrape_start": scrape_start.isoformat(),
@@ -166,6 +301,13 @@ def main(argv: list[str] | None = None) -> None:
         "max_pages_per_category": max_pages,
     }
 
+    # meta.json is what downstream pipelines read; meta.yaml stays for humans
+    if orjson is not None:
+        meta_bytes = orjson.dumps(meta, option=orjson.OPT_INDENT_2)
+    else:
+        meta_bytes = json.dumps(meta, indent=2, ensure_ascii=False).encode("utf-8")
+    (output_dir / "meta.json").write_bytes(meta_bytes)
+
     meta_path = output_dir / "meta.yaml"
     with open(meta_path, "w", encoding="utf-8") as fh:
         yaml.dump(meta, fh, default_flow_style=False, allow_unicode=True)
@@ -6,10 +6,10 @@ Orchestrates the full experiment lifecycle:
     1. create_experiment    → timestamped experiment directory
     2. snapshot_configs     → freeze YAML configs into experiment
     3. set_global_seed      → pin all stochastic sources
-    4. compute_dataset_hash → fingerprint data for versioning
+    4. compute_dataset_hash → fingerprint data for versioning (cached)
     5. load dataset         → read processed parquet
     6. temporal split       → strictly time-based train/val/test
-    7. train                → fit model(s)
+    7. train                → fit model(s), in parallel processes
     8. save model           → persist artefact into experiment
     9. save metrics         → persist evaluation metrics
    10. update metadata      → final experiment record
@@ -23,22 +23,28 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import gc
+import json
+import os
 import pickle
+import shutil
 import time
 from pathlib import Path
-from typing import Any
-
-import pandas as pd
-import yaml
+from typing import TYPE_CHECKING, Any
 
+from src.utils.config import load_config
 from src.utils.experiment import create_experiment, save_metadata
 from src.utils.config_snapshot import snapshot_configs
 from src.utils.seed import set_global_seed
-from src.utils.data_version import compute_dataset_hash
-from src.utils.split import temporal_train_val_test_split
-from src.utils.metrics import compute_classification_metrics, save_metrics
+from src.utils.data_version import compute_dataset_hash_cached
 from src.utils.logger import setup_logging, get_logger
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# numpy / pandas / pyarrow and the metrics stack are imported inside the
+# functions that use them, so ``--help`` returns without loading them.
+
 
 # ── Constants ───────────────────────────────────────────────────────────────
 
@@ -48,6 +54,15 @@ AVAILABLE_MODELS = [
     "xgboost",
 ]
 
+TARGET_COL = "sold_within_7_days"
+TIME_COL = "listed_at"
+
+_SPLITS = ("train", "val", "test")
+_READ_BATCH_SIZE = 65_536  # rows per streamed parquet record batch
+# Most recent share of train held out to drive XGBoost early stopping; val
+# is what models are compared on, so it never feeds back into fitting.
+_EARLY_STOP_FRACTION = 0.1
+
 
 # ── CLI ─────────────────────────────────────────────────────────────────────
 
@@ -99,9 +114,140 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
 
 
 def _load_yaml(path: str | Path) -> dict[str, Any]:
-    """Load a YAML file and return its contents as a dict."""
-    with open(path, encoding="utf-8") as fh:
-        return yaml.safe_load(fh) or {}
+    """Load a YAML file and return its contents as a dict (cached, read-only)."""
+    return load_config(path)
+
+
+# ── Dataset loader ─────────────────────────────────────────────────────────
+
+
+def _load_temporal_splits(
+    path: Path,
+    feature_cols: list[str] | None = None,
+    test_size: float = 0.15,
+    val_size: float = 0.15,
+    batch_size: int = _READ_BATCH_SIZE,
+) -> dict[str, Any]:
+    """Read the processed parquet straight into temporal train/val/test frames.
+
+    Two passes over the (memory-mapped) file: the first decodes only
+    ``TIME_COL`` to decide which rows land in which split, the second
+    streams record batches and routes each row to its split with an arrow
+    filter.  The full dataset is never materialised as one frame, so peak
+    memory is the three splits plus a single batch.
+
+    Only *feature_cols* plus the target and time columns are decoded (all
+    columns when *feature_cols* is ``None``).  Numeric columns are then
+    downcast (see :func:`_downcast_splits`) to the same dtypes in every
+    split.
+
+    Returns the same keys as :func:`temporal_train_val_test_split`.
+    """
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    from src.utils.split import temporal_split_positions
+
+    pf = pq.ParquetFile(path, memory_map=True)
+    schema = pf.schema_arrow
+    columns: list[str] | None = None
+    if feature_cols is not None:
+        needed = set(feature_cols) | {TARGET_COL, TIME_COL}
+        missing = sorted(needed - set(schema.names))
+        if missing:
+            raise ValueError(f"Columns not found in {path}: {missing}")
+        # Keep the on-disk column order
+        columns = [c for c in schema.names if c in needed]
+
+    # ── Pass 1: timestamps only → split membership ──────────────────────
+    times = pf.read(columns=[TIME_COL], use_threads=True).column(TIME_COL)
+    positions = temporal_split_positions(
+        times.to_pandas(), test_size=test_size, val_size=val_size
+    )
+    del times
+
+    n_rows = pf.metadata.num_rows
+    split_of = np.empty(n_rows, dtype=np.int8)
+    rank = np.empty(n_rows, dtype=np.int64)
+    for code, name in enumerate(_SPLITS):
+        split_of[positions[name]] = code
+        rank[positions[name]] = np.arange(len(positions[name]))
+
+    # ── Pass 2: stream batches, route rows to their split ──────────────
+    parts: dict[str, list[pa.RecordBatch]] = {name: [] for name in _SPLITS}
+    ranks: dict[str, list[np.ndarray]] = {name: [] for name in _SPLITS}
+    offset = 0
+    for batch in pf.iter_batches(batch_size=batch_size, columns=columns, use_threads=True):
+        end = offset + batch.num_rows
+        batch_split = split_of[offset:end]
+        for code, name in enumerate(_SPLITS):
+            mask = batch_split == code
+            if mask.any():
+                parts[name].append(batch.filter(pa.array(mask)))
+                ranks[name].append(rank[offset:end][mask])
+        offset = end
+
+    out_schema = pf.schema_arrow if columns is None else pa.schema(
+        [schema.field(c) for c in columns]
+    )
+    splits: dict[str, Any] = {}
+    for name in _SPLITS:
+        table = pa.Table.from_batches(parts[name], schema=out_schema)
+        parts[name].clear()
+        if table.num_rows:
+            # Batches arrive in storage order — restore chronological order
+            table = table.take(pa.array(np.argsort(np.concatenate(ranks[name]))))
+        splits[name] = table.to_pandas()
+    _downcast_splits([splits[name] for name in _SPLITS])
+
+    splits["cutoff_val"] = positions["cutoff_val"]
+    splits["cutoff_test"] = positions["cutoff_test"]
+    splits["split_sizes"] = positions["split_sizes"]
+    return splits
+
+
+def _downcast_splits(frames: list[pd.DataFrame]) -> None:
+    """Shrink numeric dtypes of the split frames in place.
+
+    Every dtype is decided once, from the columns' dtypes (shared by all
+    splits, as they come from one schema) and their range over *all*
+    splits, so train, val and test always end up with identical dtypes:
+
+    - ``float64`` → ``float32``
+    - ``int64`` features → the smallest integer type holding every split's
+      values (an empty column stays ``int64``)
+    - target → ``int8``, or nullable ``Int8`` when any split has missing
+      labels (a plain ``int8`` cast would raise on them)
+    """
+    import pandas as pd
+
+    columns = frames[0].columns
+    casts: dict[str, Any] = {}
+    for col in columns:
+        dtype = frames[0][col].dtype
+        if col == TARGET_COL:
+            has_na = any(df[col].isna().any() for df in frames)
+            casts[col] = "Int8" if has_na else "int8"
+        elif dtype == "float64":
+            casts[col] = "float32"
+        elif dtype == "int64":
+            lows = [df[col].min() for df in frames if len(df)]
+            highs = [df[col].max() for df in frames if len(df)]
+            if lows:
+                bounds = pd.Series([min(lows), max(highs)])
+                casts[col] = pd.to_numeric(bounds, downcast="integer").dtype
+
+    for df in frames:
+        if TIME_COL in columns and not pd.api.types.is_datetime64_any_dtype(df[TIME_COL]):
+            df[TIME_COL] = pd.to_datetime(df[TIME_COL])
+        for col, dtype in casts.items():
+            df[col] = df[col].astype(dtype)
+    if TIME_COL in columns:
+        # Parsed resolution depends on the values — align it to train's
+        time_dtype = frames[0][TIME_COL].dtype
+        for df in frames[1:]:
+            df[TIME_COL] = df[TIME_COL].astype(time_dtype)
 
 
 # ── Model factory ──────────────────────────────────────────────────────────
@@ -126,7 +272,14 @@ def _build_model(model_name: str, params: dict[str, Any], seed: int) -> Any:
     if model_name == "xgboost":
         from xgboost import XGBClassifier
 
-        p = {k: v for k, v in params.items() if k != "early_stopping_rounds"}
+        # ``early_stopping_rounds`` stays a constructor argument (xgboost>=2);
+        # it takes effect through the train-tail ``eval_set`` in ``_fit_one``.
+        p = dict(params)
+        # Histogram trees: features are quantised once (the sklearn wrapper
+        # builds a QuantileDMatrix for ``hist``), on GPU when available.
+        p.setdefault("tree_method", "hist")
+        p.setdefault("device", "cuda" if _cuda_available() else "cpu")
+        p.setdefault("max_bin", 256)
         return XGBClassifier(
             random_state=seed,
             use_label_encoder=False,
@@ -137,25 +290,141 @@ def _build_model(model_name: str, params: dict[str, Any], seed: int) -> Any:
     raise ValueError(f"Unknown model: {model_name}")
 
 
+def _cuda_available() -> bool:
+    """Return ``True`` if xgboost has CUDA support and a GPU is visible."""
+    import xgboost
+
+    if not xgboost.build_info().get("USE_CUDA", False):
+        return False
+    return shutil.which("nvidia-smi") is not None
+
+
 # ── Model persistence ──────────────────────────────────────────────────────
 
 
+def _model_compression() -> str | tuple[str, int] | int:
+    """Return the joblib ``compress`` setting: lz4 if installed, else zlib-3."""
+    try:
+        import lz4.frame  # noqa: F401
+    except ImportError:
+        return 3
+    return ("lz4", 3)
+
+
 def _save_model(model: Any, exp_dir: Path, model_name: str) -> Path:
-    """Pickle a trained model into the experiment directory."""
+    """Persist a trained model into the experiment directory.
+
+    XGBoost models are written in the native UBJSON format (fast and
+    version-portable); every other estimator goes through joblib's
+    numpy-aware pickler with compression.  joblib already streams each
+    numpy buffer (forest node arrays, coefficients) straight to the file
+    outside the pickle byte stream, which is what protocol-5 out-of-band
+    buffers would give us — so no hand-rolled framing is needed here.
+    """
+    import joblib
+
     models_dir = exp_dir / "models"
     models_dir.mkdir(parents=True, exist_ok=True)
+
+    if model_name == "xgboost":
+        out_path = models_dir / "xgboost.ubj"
+        model.save_model(str(out_path))
+        return out_path
+
     out_path = models_dir / f"{model_name}.pkl"
-    with open(out_path, "wb") as fh:
-        pickle.dump(model, fh, protocol=pickle.HIGHEST_PROTOCOL)
+    joblib.dump(
+        model,
+        out_path,
+        compress=_model_compression(),
+        protocol=pickle.HIGHEST_PROTOCOL,
+    )
     return out_path
 
 
+# ── Training worker ─────────────────────────────────────────────────────────
+
+
+def _fit_one(
+    model_name: str,
+    params: dict[str, Any],
+    seed: int,
+    exp_dir: Path,
+    x_train: Any,
+    y_train: Any,
+    x_val: Any,
+    y_val: Any,
+    feature_names: list[str],
+) -> dict[str, Any]:
+    """Build, fit, persist and evaluate a single model.
+
+    Runs inside a joblib worker process, so it only touches the filesystem
+    and returns plain data; logging happens in the parent.
+    """
+    import pandas as pd
+
+    from src.utils.metrics import compute_classification_metrics, save_metrics
+
+    # Zero-copy named views over the float32 arrays, so the fitted model
+    # records ``feature_names_in_`` (booster feature names for XGBoost)
+    x_train = pd.DataFrame(x_train, columns=feature_names, copy=False)
+    x_val = pd.DataFrame(x_val, columns=feature_names, copy=False)
+
+    # ── Build model ─────────────────────────────────────────────────
+    model = _build_model(model_name, params, seed)
+
+    # ── Train ───────────────────────────────────────────────────────
+    t0 = time.perf_counter()
+    if model_name == "xgboost":
+        # Train is chronological → its newest rows stand in for "future"
+        # data when deciding how many rounds to keep.
+        n_fit = len(y_train) - max(1, int(len(y_train) * _EARLY_STOP_FRACTION))
+        model.fit(
+            x_train.iloc[:n_fit],
+            y_train[:n_fit],
+            eval_set=[(x_train.iloc[n_fit:], y_train[n_fit:])],
+            verbose=False,
+        )
+    else:
+        model.fit(x_train, y_train)
+    train_time = time.perf_counter() - t0
+    best_iteration = getattr(model, "best_iteration", None)
+
+    # ── 8. Save model artefact ──────────────────────────────────────
+    model_path = _save_model(model, exp_dir, model_name)
+
+    # ── 9. Evaluate & save metrics ──────────────────────────────────
+    y_val_pred = model.predict(x_val)
+    y_val_prob = (
+        model.predict_proba(x_val)[:, 1]
+        if hasattr(model, "predict_proba")
+        else None
+    )
+
+    val_metrics = compute_classification_metrics(y_val, y_val_pred, y_val_prob)
+    val_metrics["train_time_seconds"] = round(train_time, 4)
+    if best_iteration is not None:
+        val_metrics["best_iteration"] = int(best_iteration)
+    val_metrics["split"] = "val"
+
+    metrics_path = save_metrics(exp_dir, val_metrics, model_name=model_name)
+
+    return {
+        "model_name": model_name,
+        "metrics": val_metrics,
+        "model_path": model_path,
+        "metrics_path": metrics_path,
+        "train_time": train_time,
+    }
+
+
 # ── Main pipeline ───────────────────────────────────────────────────────────
 
 
 def main(argv: list[str] | None = None) -> None:
     args = parse_args(argv)
 
+    import numpy as np
+
     # ── 1. Create experiment ────────────────────────────────────────────
     exp = create_experiment(name=args.experiment_name or "train")
     exp_id: str = exp["exp_id"]
@@ -184,7 +453,7 @@ def main(argv: list[str] | None = None) -> None:
     # ── 4. Compute dataset hash ─────────────────────────────────────────
     data_dir = Path(args.data_dir)
     if data_dir.exists() and any(data_dir.iterdir()):
-        dataset_hash = compute_dataset_hash(data_dir, glob_pattern="*.parquet")
+        dataset_hash = compute_dataset_hash_cached(data_dir, glob_pattern="*.parquet")
         logger.info("Dataset hash: {}", dataset_hash[:16] + "…")
     else:
         dataset_hash = "no_data"
@@ -204,16 +473,15 @@ def main(argv: list[str] | None = None) -> None:
         logger.info("Experiment directory: {}", exp_dir)
         return
 
-    df = pd.read_parquet(dataset_path)
-    logger.info("Loaded dataset: {} rows × {} cols", len(df), len(df.columns))
-
-    # ── 6. Temporal split — strictly time-based ─────────────────────────
     test_size = model_cfg.get("experiment", {}).get("test_size", 0.15)
     val_size = model_cfg.get("experiment", {}).get("val_size", 0.15)
 
-    splits = temporal_train_val_test_split(
-        df,
-        time_col="listed_at",
+    # ── 6. Temporal split — strictly time-based ─────────────────────────
+    # Split membership is decided from the time column alone and each
+    # split's rows are then streamed in, so the full frame never exists.
+    splits = _load_temporal_splits(
+        dataset_path,
+        feature_cols=model_cfg.get("experiment", {}).get("feature_columns"),
         test_size=test_size,
         val_size=val_size,
     )
@@ -222,6 +490,11 @@ def main(argv: list[str] | None = None) -> None:
     val_df = splits["val"]
     test_df = splits["test"]
 
+    logger.info(
+        "Loaded dataset: {} rows × {} cols",
+        sum(splits["split_sizes"].values()),
+        len(train_df.columns),
+    )
     logger.info(
         "Temporal split → train={}, val={}, test={}",
         len(train_df),
@@ -241,12 +514,42 @@ def main(argv: list[str] | None = None) -> None:
     )
 
     # ── Separate features / target ──────────────────────────────────────
-    target_col = "sold_within_7_days"
-    feature_cols = [c for c in train_df.columns if c not in (target_col, "listed_at")]
+    target_col = TARGET_COL
+    feature_cols = [c for c in train_df.columns if c not in (target_col, TIME_COL)]
+
+    # Listings whose outcome is still unknown can be neither fit nor scored
+    for name, df in (("train", train_df), ("val", val_df), ("test", test_df)):
+        n_unlabelled = int(df[target_col].isna().sum())
+        if n_unlabelled:
+            df.dropna(subset=[target_col], inplace=True)
+            logger.warning("Dropped {} unlabelled rows from {}", n_unlabelled, name)
+
+    from pandas.api.types import is_numeric_dtype
+
+    non_numeric = [c for c in feature_cols if not is_numeric_dtype(train_df[c])]
+    if non_numeric:
+        raise ValueError(
+            f"Feature columns must be numeric; encode these in build_dataset: {non_numeric}"
+        )
 
-    X_train, y_train = train_df[feature_cols], train_df[target_col]
-    X_val, y_val = val_df[feature_cols], val_df[target_col]
-    X_test, y_test = test_df[feature_cols], test_df[target_col]
+    # Workers get plain float32 / int8 arrays (memmapped by loky, no
+    # per-split DataFrame copies) plus the column names, which _fit_one
+    # reattaches so models keep ``feature_names_in_``.  The names also go
+    # to features.json for anything that needs them later (SHAP).
+    X_train = train_df[feature_cols].to_numpy(dtype=np.float32, copy=False)
+    y_train = train_df[target_col].to_numpy(dtype=np.int8, copy=False)
+    X_val = val_df[feature_cols].to_numpy(dtype=np.float32, copy=False)
+    y_val = val_df[target_col].to_numpy(dtype=np.int8, copy=False)
+    X_test = test_df[feature_cols].to_numpy(dtype=np.float32, copy=False)
+    y_test = test_df[target_col].to_numpy(dtype=np.int8, copy=False)
+
+    (exp_dir / "features.json").write_text(
+        json.dumps(feature_cols, indent=2), encoding="utf-8"
+    )
+
+    # Release the pandas-held copies before fitting
+    del splits, train_df, val_df, test_df
+    gc.collect()
 
     # ── 7. Determine which models to train ──────────────────────────────
     if args.model:
@@ -264,44 +567,53 @@ def main(argv: list[str] | None = None) -> None:
         return
 
     logger.info("Models to train: {}", models_to_train)
-    all_results: dict[str, dict[str, Any]] = {}
-
-    for model_name in models_to_train:
-        logger.info("─── Training: {} ───", model_name)
-        params = model_cfg.get(model_name, {}).get("params", {})
 
-        # ── Build model ─────────────────────────────────────────────
-        model = _build_model(model_name, params, seed)
-
-        # ── Train ───────────────────────────────────────────────────
-        t0 = time.perf_counter()
-        model.fit(X_train, y_train)
-        train_time = time.perf_counter() - t0
-
-        logger.info("{} trained in {:.2f}s", model_name, train_time)
-
-        # ── 8. Save model artefact ──────────────────────────────────
-        model_path = _save_model(model, exp_dir, model_name)
-        logger.info("Model saved → {}", model_path)
-
-        # ── 9. Evaluate & save metrics ──────────────────────────────
-        y_val_pred = model.predict(X_val)
-        y_val_prob = (
-            model.predict_proba(X_val)[:, 1]
-            if hasattr(model, "predict_proba")
-            else None
+    # Models are independent → fit them in parallel worker processes.
+    # loky memmaps the (large) training arrays instead of copying them into
+    # every worker, and caps each worker's BLAS/OpenMP pool so k workers
+    # share the cores rather than oversubscribing them.
+    import joblib
+
+    n_cpus = os.cpu_count() or 1
+    n_jobs = min(len(models_to_train), n_cpus)
+    logger.info("Training {} model(s) with n_jobs={}", len(models_to_train), n_jobs)
+
+    with joblib.parallel_config(
+        backend="loky",
+        inner_max_num_threads=max(1, n_cpus // n_jobs),
+    ):
+        fitted = joblib.Parallel(n_jobs=n_jobs, max_nbytes="1M", mmap_mode="r")(
+            joblib.delayed(_fit_one)(
+                model_name,
+                model_cfg.get(model_name, {}).get("params", {}),
+                seed,
+                exp_dir,
+                X_train,
+                y_train,
+                X_val,
+                y_val,
+                feature_cols,
+            )
+            for model_name in models_to_train
         )
 
-        val_metrics = compute_classification_metrics(y_val, y_val_pred, y_val_prob)
-        val_metrics["train_time_seconds"] = round(train_time, 4)
-        val_metrics["split"] = "val"
-
-        metrics_path = save_metrics(exp_dir, val_metrics, model_name=model_name)
-        logger.info("{} val metrics saved → {}", model_name, metrics_path)
+    all_results: dict[str, dict[str, Any]] = {}
 
-        for k, v in sorted(val_metrics.items()):
-            if isinstance(v, float):
-                logger.info("  {}: {:.4f}", k, v)
+    for res in fitted:
+        model_name = res["model_name"]
+        val_metrics = res["metrics"]
+        logger.info("─── Trained: {} ───", model_name)
+        logger.info("{} trained in {:.2f}s", model_name, res["train_time"])
+        if "best_iteration" in val_metrics:
+            logger.info("{} best iteration: {}", model_name, val_metrics["best_iteration"])
+        logger.info("Model saved → {}", res["model_path"])
+        logger.info("{} val metrics saved → {}", model_name, res["metrics_path"])
+
+        # One log record per model rather than one per metric
+        pretty = " ".join(
+            f"{k}={v:.4f}" for k, v in sorted(val_metrics.items()) if isinstance(v, float)
+        )
+        logger.info("{} val metrics: {}", model_name, pretty)
 
         all_results[model_name] = val_metrics
 
@@ -6,14 +6,24 @@ Public API
 DolapScraper        — Selenium-powered scraper with Cloudflare bypass
 load_scraping_config — Load scraping.yaml configuration
 parse_product_detail — Parse raw HTML into structured dict
+parse_product_detail_cached — Same, memoised on page content
+parse_product_details_batch — Parse many pages into one DataFrame
+parse_product_details_parallel — Parse many pages across processes
 parse_listing_urls_from_page — Extract listing URLs from category HTML
+parse_listing_urls_from_page_stream — Same, streaming (low memory)
 extract_listing_id_from_url  — Pull numeric listing ID from URL slug
+ParsedPageBuilder   — Column-wise page accumulator → Arrow / Parquet
 """
 
+from src.scraping.page_builder import ParsedPageBuilder
 from src.scraping.parsers import (
     extract_listing_id_from_url,
     parse_listing_urls_from_page,
+    parse_listing_urls_from_page_stream,
     parse_product_detail,
+    parse_product_detail_cached,
+    parse_product_details_batch,
+    parse_product_details_parallel,
 )
 from src.scraping.scraper import DolapScraper, load_scraping_config
 
@@ -21,6 +31,11 @@ __all__ = [
     "DolapScraper",
     "load_scraping_config",
     "parse_product_detail",
+    "parse_product_detail_cached",
+    "parse_product_details_batch",
+    "parse_product_details_parallel",
     "parse_listing_urls_from_page",
+    "parse_listing_urls_from_page_stream",
     "extract_listing_id_from_url",
+    "ParsedPageBuilder",
 ]
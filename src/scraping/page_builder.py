@@ -0,0 +1,205 @@
+"""
+Column-wise accumulator for parsed product pages.
+
+``parse_product_detail`` returns one ``dict`` per page; collecting those and
+calling ``pd.DataFrame.from_records`` transposes every record in Python.
+:class:`ParsedPageBuilder` keeps one list per field instead
+(struct-of-arrays) and turns them straight into typed Arrow columns —
+``float32`` prices and ``int32`` counts, half the bytes of pandas' default
+``float64`` / ``int64`` on disk and in memory.  With a *path* it writes a
+Parquet row group every *flush_every* pages, so memory stays bounded for
+arbitrarily long scraping runs.
+
+Usage:
+    from src.scraping.page_builder import ParsedPageBuilder
+
+    with ParsedPageBuilder("data/raw/pages.parquet") as builder:
+        for html, url in pages:
+            builder.append(html, url)
+
+    table = ParsedPageBuilder().extend(htmls, urls).to_arrow()
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from bs4 import Tag
+
+from src.scraping.parsers import parse_product_detail
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+# Output columns in ``parse_product_detail`` key order, with their Arrow type
+# (names resolved lazily so importing this module does not need pyarrow).
+_FIELDS: tuple[tuple[str, str], ...] = (
+    ("url", "string"),
+    ("listing_id", "string"),
+    ("category", "string"),
+    ("subcategory", "string"),
+    ("brand", "string"),
+    ("title", "string"),
+    ("price", "float32"),
+    ("original_price", "float32"),
+    ("has_discount", "bool_"),
+    ("condition", "string"),
+    ("color", "string"),
+    ("size", "string"),
+    ("description_text", "string"),
+    ("description_length", "int32"),
+    ("description_word_count", "int32"),
+    ("photo_count", "int32"),
+    ("like_count", "int32"),
+    ("comment_count", "int32"),
+    ("shipping_info", "string"),
+    ("shipping_buyer_pays", "bool_"),
+    ("seller_username", "string"),
+    ("seller_listing_count", "int32"),
+    ("is_sold", "bool_"),
+    ("_parse_errors", "list_of_string"),
+)
+
+_DEFAULT_FLUSH_EVERY = 10_000  # pages per Parquet row group
+
+
+def _arrow_schema() -> pa.Schema:
+    import pyarrow as pa
+
+    def resolve(name: str) -> pa.DataType:
+        if name == "list_of_string":
+            return pa.list_(pa.string())
+        return getattr(pa, name)()
+
+    return pa.schema([(field, resolve(type_name)) for field, type_name in _FIELDS])
+
+
+# ── Public API ──────────────────────────────────────────────────────────────
+
+
+class ParsedPageBuilder:
+    """Accumulate parsed product pages column-wise.
+
+    Parameters
+    ----------
+    path : str | Path | None
+        Parquet file to stream row groups into.  ``None`` (default) keeps
+        everything in memory for :meth:`to_arrow`.
+    flush_every : int
+        With a *path*, pages buffered before a row group is written.
+        Default ``10_000``.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        flush_every: int = _DEFAULT_FLUSH_EVERY,
+    ) -> None:
+        self.path = Path(path) if path is not None else None
+        self.flush_every = max(1, flush_every)
+        self._columns: dict[str, list[Any]] = {field: [] for field, _ in _FIELDS}
+        self._writer: Any = None  # pyarrow.parquet.ParquetWriter, opened lazily
+        self.rows_written = 0
+        self._closed = False
+
+    def __len__(self) -> int:
+        """Number of buffered (not yet flushed) pages."""
+        return len(self._columns["url"])
+
+    # ── Accumulation ────────────────────────────────────────────────────
+
+    def append(
+        self,
+        html: str | bytes | Tag,
+        url: str = "",
+        **parse_kwargs: Any,
+    ) -> None:
+        """Parse one page with ``parse_product_detail`` and buffer its fields."""
+        self.append_record(parse_product_detail(html, url, **parse_kwargs))
+
+    def append_record(self, record: Mapping[str, Any]) -> None:
+        """Buffer an already-parsed ``parse_product_detail`` record."""
+        for field, column in self._columns.items():
+            column.append(record.get(field))
+        if self.path is not None and len(self) >= self.flush_every:
+            self.flush()
+
+    def extend(
+        self,
+        htmls: Iterable[str | bytes | Tag],
+        urls: Iterable[str] | None = None,
+        **parse_kwargs: Any,
+    ) -> ParsedPageBuilder:
+        """Parse and buffer many pages; returns ``self`` for chaining."""
+        if urls is None:
+            for html in htmls:
+                self.append(html, **parse_kwargs)
+        else:
+            for html, url in zip(htmls, urls, strict=True):
+                self.append(html, url, **parse_kwargs)
+        return self
+
+    # ── Output ──────────────────────────────────────────────────────────
+
+    def to_arrow(self) -> pa.Table:
+        """Return the buffered pages as a typed ``pyarrow.Table``."""
+        import pyarrow as pa
+
+        schema = _arrow_schema()
+        return pa.Table.from_arrays(
+            [
+                pa.array(self._columns[field.name], type=field.type)
+                for field in schema
+            ],
+            schema=schema,
+        )
+
+    def flush(self) -> None:
+        """Write buffered pages to *path* as one row group and clear them."""
+        if self.path is None:
+            raise ValueError("flush() needs a builder created with a path")
+        if not len(self):
+            return
+        import pyarrow.parquet as pq
+
+        table = self.to_arrow()
+        if self._writer is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._writer = pq.ParquetWriter(self.path, table.schema)
+        self._writer.write_table(table)
+        self.rows_written += table.num_rows
+        for column in self._columns.values():
+            column.clear()
+
+    def close(self) -> None:
+        """Flush remaining pages and finalise the Parquet file."""
+        if self.path is None or self._closed:
+            return
+        self.flush()
+        if self._writer is None:
+            # Nothing was ever appended — still leave a valid (empty) file
+            import pyarrow.parquet as pq
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._writer = pq.ParquetWriter(self.path, _arrow_schema())
+        self._writer.close()
+        self._writer = None
+        self._closed = True
+
+    def write_parquet(self, path: str | Path) -> Path:
+        """Write the buffered pages to *path* in one go (in-memory builders)."""
+        import pyarrow.parquet as pq
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(self.to_arrow(), path)
+        return path
+
+    def __enter__(self) -> ParsedPageBuilder:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
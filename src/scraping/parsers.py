@@ -16,29 +16,365 @@ Design contract
 
 from __future__ import annotations
 
+import contextlib
+import hashlib
+import os
 import re
-from typing import Any
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Sequence
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlparse
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover — optional speed-up
+    ahocorasick = None
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover — optional speed-up (blake2b fallback)
+    xxhash = None
+
+try:
+    from lxml import etree as _lxml_etree
+    from lxml import html as _lxml_html
+
+    _HTML_PARSER = "lxml"
+except ImportError:  # pragma: no cover — fall back to the stdlib builder
+    _lxml_etree = None
+    _lxml_html = None
+    _HTML_PARSER = "html.parser"
 
 
 # ── Regex helpers ───────────────────────────────────────────────────────────
 
 _PRICE_RE = re.compile(r"([\d.,]+)\s*TL", re.IGNORECASE)
+_PRICE_TRANSLATION = str.maketrans({".": None, ",": "."})
 _NUMERIC_RE = re.compile(r"(\d+)")
-_ID_FROM_URL_RE = re.compile(r"-(\d{6,})$")  # trailing numeric id in slug
+_MIN_LISTING_ID_LEN = 6  # trailing numeric id in slug has at least 6 digits
+_LIKES_RE = re.compile(r"(\d+)\s*Beğeni")
+_COMMENTS_PAREN_RE = re.compile(r"Yorumlar?\s*\((\d+)\)")
+_COMMENTS_RE = re.compile(r"(\d+)\s*Yorum")
+_PAREN_COUNT_RE = re.compile(r"\((\d+)\)")
+
+# ── Parse filters ───────────────────────────────────────────────────────────
+
+# Listing pages only need their anchors.  Product pages are parsed in full:
+# a strainer only filters top-level nodes, so skipping <script>/<style> that
+# way means rejecting <html>/<body> too — and with them every text node
+# sitting directly under <body>, which the page-text fields depend on.
+_LISTING_STRAINER = SoupStrainer("a", href=True)
+
+# Dolap serves UTF-8; passing it explicitly skips UnicodeDammit detection
+_DEFAULT_ENCODING = "utf-8"
+
+# Photo detection: CDN markers in <img src>, category words in <img alt>
+_PHOTO_SRC_TOKENS = ("product", "dlp_", "dsmcdn")
+_PHOTO_ALT_TOKENS = ("Telefon", "Kazak", "Elbise")
+
+# Pages per chunk in ``parse_product_details_batch``
+_BATCH_CHUNK_SIZE = 256
+# Parsed records kept by ``parse_product_detail_cached`` (LRU)
+_PARSE_CACHE_SIZE = 4096
+# Pages handed to a worker per task in ``parse_product_details_parallel``
+_PARALLEL_CHUNK_SIZE = 64
+# Characters (or bytes) fed to the pull parser per step when streaming
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+# href filters handed to ``find_all`` so non-matching anchors are skipped
+# inside bs4's matcher instead of being looped over here
+_LISTING_HREF_RE = re.compile(r"/urun/")
+_PROFILE_HREF_RE = re.compile(r"/profil/")
+_SITE_HREF_RE = re.compile(r"^(?:https://dolap\.com/|/)")
+# Absolute hrefs on the site's own origin: the path is everything after the
+# prefix up to ``?``/``#`` (see ``_href_path``).
+_SITE_ORIGINS = ("https://dolap.com", "http://dolap.com")
+# Characters ``urlparse`` treats specially inside the path.
+_URLPARSE_SPECIAL = frozenset(";\t\r\n")
+
+# Literal badges, highest priority first.
+_CONDITIONS = (
+    "Yeni ve Etiketli",
+    "Yeni & Etiketli",
+    "Yeni",
+    "Az Kullanılmış",
+    "Çok Kullanılmış",
+    "Kullanılmış",
+    "Defolu",
+)
+_SHIPPING_PATTERNS = (
+    "Alıcı Ödemeli Kargo",
+    "Alıcı Öder",
+    "Ücretsiz Kargo",
+    "Satıcı Öder",
+    "Kargo Dahil",
+)
+_SOLD_INDICATORS = (
+    "Satıldı",
+    "Bu ürün satılmıştır",
+    "SATILDI",
+    "sold",
+)
+
+
+# All badge literals in one pattern so the page text is scanned once for
+# every field.  Each alternative sits in a zero-width lookahead, so a hit
+# for one field never consumes text another field's literal starts in;
+# group ``b<field>_<priority>`` identifies the entry.
+_BADGE_FIELDS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("condition", _CONDITIONS),
+    ("shipping_info", _SHIPPING_PATTERNS),
+    ("is_sold", _SOLD_INDICATORS),
+)
+_BADGE_RE = re.compile(
+    "(?=" + "|".join(
+        f"(?P<b{f}_{i}>{re.escape(lit)})"
+        for f, (_, literals) in enumerate(_BADGE_FIELDS)
+        for i, lit in enumerate(literals)
+    ) + ")"
+)
+
+# Description heuristics: boilerplate markers (case-sensitive) and product
+# keywords (matched against the lower-cased line).
+_DESC_SKIP = (
+    "KATEGORİLER", "BENZER ÜRÜNLER", "Popüler Aramalar",
+    "Dolap Hakkında", "Kol Çantası", "Kategoriler",
+    "Tanımlama bilgilerini", "Ödeme Seçenekleri",
+    "Yorum Yayınlanma", "PAYLAŞ", "Dolap Avantajları",
+)
+_DESC_KEYWORDS = (
+    "kılıf", "elbise", "kazak", "mont", "pantolon", "ayakkabı",
+    "çanta", "gömlek", "etek", "tshirt", "bot", "çizme",
+    "kullanılmamış", "sıfır", "orjinal", "modelleri", "mevcut",
+    "renk", "beden", "kargo", "yeni", "tertemiz",
+)
+
+
+def _build_automaton(words: tuple[str, ...]) -> Any:
+    """Aho–Corasick automaton over *words*, or ``None`` without pyahocorasick."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for word in words:
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return automaton
+
+
+_DESC_SKIP_AC = _build_automaton(_DESC_SKIP)
+_DESC_KEYWORDS_AC = _build_automaton(_DESC_KEYWORDS)
+
+# Size patterns, highest priority first; ``v<i>`` holds the captured value.
+# Common patterns: "S", "M", "L", "36", "38", "4XL / 48"
+_SIZE_RE = re.compile(
+    r"(?P<p0>Beden[:\s]+(?P<v0>[A-Z0-9/\s]+))"
+    r"|(?P<p1>(?P<v1>\d{1,2}XL\s*/\s*\d{2}))"
+    r"|(?P<p2>Beden\s*:\s*(?P<v2>\S+))",
+    re.IGNORECASE,
+)
 
 
 # ── Low-level helpers ───────────────────────────────────────────────────────
 
 
-def _to_soup(html: str | Tag) -> BeautifulSoup:
-    """Ensure we always work with a BeautifulSoup object."""
-    if isinstance(html, BeautifulSoup):
-        return html
+def _to_soup(
+    html: str | bytes | Tag,
+    strainer: SoupStrainer | None = None,
+    encoding: str | None = _DEFAULT_ENCODING,
+) -> BeautifulSoup | Tag:
+    """Ensure we always work with an already-parsed tree.
+
+    ``Tag`` inputs (including ``BeautifulSoup``) are searched in place —
+    they expose the same ``find`` / ``find_all`` / ``get_text`` API, so
+    serialising and re-parsing them would only cost time.  Raw HTML is
+    parsed through *strainer* when given (whole document otherwise); for
+    ``bytes`` input *encoding* is passed as ``from_encoding`` (``None`` =
+    detect).
+    """
     if isinstance(html, Tag):
-        return BeautifulSoup(str(html), "html.parser")
-    return BeautifulSoup(html, "html.parser")
+        return html
+    if isinstance(html, (bytes, bytearray)):
+        return BeautifulSoup(
+            html, _HTML_PARSER, parse_only=strainer, from_encoding=encoding
+        )
+    return BeautifulSoup(html, _HTML_PARSER, parse_only=strainer)
+
+
+def _href_path(href: str) -> str:
+    """Return ``urlparse(href).path``, slicing directly for on-site URLs.
+
+    Listing pages link to ``https://dolap.com/urun/…``; for those the path
+    is just the text between the origin and the first ``?``/``#``, which
+    avoids the full ``urlparse`` state machine.  Anything unusual (other
+    hosts, ports, ``;params``, embedded whitespace) still goes through
+    ``urlparse`` so the result is always identical.
+    """
+    for origin in _SITE_ORIGINS:
+        if href.startswith(origin) and href[len(origin):len(origin) + 1] == "/":
+            path = href[len(origin):]
+            for sep in "?#":
+                cut = path.find(sep)
+                if cut != -1:
+                    path = path[:cut]
+            if _URLPARSE_SPECIAL.isdisjoint(path):
+                return path
+            break
+    return urlparse(href).path
+
+
+_PARSE_CACHE: OrderedDict[tuple[bytes, str, str | None], dict[str, Any]] = OrderedDict()
+_PARSE_CACHE_LOCK = threading.Lock()
+
+
+def _content_digest(html: str | bytes) -> bytes:
+    """16-byte digest of a page (``str`` is hashed as UTF-8)."""
+    data = html.encode("utf-8", "surrogatepass") if isinstance(html, str) else bytes(html)
+    if xxhash is not None:
+        return xxhash.xxh3_128_digest(data)
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _listing_paths(hrefs: Iterable[str]) -> list[str]:
+    """Keep ``/urun/`` hrefs as site paths, deduplicated in order."""
+    seen: set[str] = set()
+    urls: list[str] = []
+
+    for href in hrefs:
+        if "/urun/" in href:
+            # Normalise: strip domain if present
+            if href.startswith("http"):
+                # keep path only
+                href = _href_path(href)
+            if href not in seen:
+                seen.add(href)
+                urls.append(href)
+    return urls
+
+
+def _prune_before(el: Any) -> None:
+    """Delete every already-parsed sibling left of *el* and its ancestors.
+
+    What remains is the open path from the root to *el* — the only part
+    of the tree libxml2 can still append to.
+    """
+    node = el
+    while (parent := node.getparent()) is not None:
+        while node.getprevious() is not None:
+            del parent[0]
+        node = parent
+
+
+def _lxml_hrefs(html: str) -> list[str] | None:
+    """Return the ``href`` of every ``<a href>`` in *html*, parsed with lxml.
+
+    ``None`` means lxml refused the input (e.g. a ``str`` carrying an XML
+    encoding declaration) and the caller should fall back to bs4.
+    """
+    if not html.strip():
+        return []
+    try:
+        tree = _lxml_html.document_fromstring(html)
+    except (_lxml_etree.ParserError, ValueError):
+        return None
+    return [str(h) for h in tree.xpath("//a[@href]/@href")]
+
+
+def _search_by_priority(
+    pattern: re.Pattern[str],
+    text: str,
+    candidates: Iterable[int] | None = None,
+) -> re.Match[str] | None:
+    """Return the match of the highest-priority alternative in *text*.
+
+    *pattern* is an alternation of named groups ``p0``, ``p1``, … ordered by
+    priority.  Walking the matches once keeps the "first pattern that
+    matches anywhere" semantics — not simply the leftmost occurrence —
+    while scanning *text* a single time.
+
+    *candidates*, when given, are the ascending positions where a match can
+    possibly start; the regex is only tried there (same non-overlapping
+    walk as ``finditer``), which skips the per-character scan entirely.
+    """
+    if candidates is None:
+        matches: Iterable[re.Match[str]] = pattern.finditer(text)
+    else:
+        matches = _match_at(pattern, text, candidates)
+
+    best: re.Match[str] | None = None
+    for m in matches:
+        if best is None or _alt_index(m) < _alt_index(best):
+            best = m
+            if _alt_index(m) == 0:
+                break
+    return best
+
+
+def _match_at(
+    pattern: re.Pattern[str], text: str, positions: Iterable[int]
+) -> Iterator[re.Match[str]]:
+    """``finditer`` restricted to *positions* (ascending)."""
+    end = 0
+    for pos in positions:
+        if pos < end:
+            continue
+        m = pattern.match(text, pos)
+        if m:
+            yield m
+            end = m.end()
+
+
+def _find_all(haystack: str, needle: str) -> Iterator[int]:
+    """Yield every start index of *needle* in *haystack* (overlapping)."""
+    i = haystack.find(needle)
+    while i != -1:
+        yield i
+        i = haystack.find(needle, i + 1)
+
+
+def _alt_index(m: re.Match[str]) -> int:
+    """Index of the top-level ``p<i>`` alternative that produced *m*."""
+    return int(m.lastgroup[1:])
+
+
+def _scan_page_text(page_text: str) -> dict[str, Any]:
+    """Detect condition, shipping and sold badges in one pass over *page_text*.
+
+    For condition / shipping the highest-priority literal that occurs
+    anywhere wins (list order, as before); ``is_sold`` is True on any hit.
+    """
+    n_fields = len(_BADGE_FIELDS)
+    best = [len(literals) for _, literals in _BADGE_FIELDS]  # sentinel: none
+    for m in _BADGE_RE.finditer(page_text):
+        field, prio = map(int, m.lastgroup[1:].split("_"))
+        if prio < best[field]:
+            best[field] = prio
+            if not any(best):  # every field at top priority — done
+                break
+
+    result: dict[str, Any] = {}
+    for f in range(n_fields):
+        name, literals = _BADGE_FIELDS[f]
+        result[name] = literals[best[f]] if best[f] < len(literals) else None
+    result["is_sold"] = result["is_sold"] is not None
+    return result
+
+
+def _contains_any(automaton: Any, words: tuple[str, ...], text: str) -> bool:
+    """Return True if any of *words* occurs in *text*.
+
+    One linear Aho–Corasick pass when *automaton* is available, otherwise a
+    plain substring scan per word, which beats one ``"|".join(words)`` regex
+    on lines without a hit (the common case).
+    """
+    if automaton is not None:
+        return next(automaton.iter(text), None) is not None
+    return any(word in text for word in words)
 
 
 def _first_int(text: str | None) -> int | None:
@@ -56,25 +392,54 @@ def _extract_price(text: str | None) -> float | None:
     m = _PRICE_RE.search(text)
     if not m:
         return None
-    raw = m.group(1).replace(".", "").replace(",", ".")
+    return _to_price(m.group(1))
+
+
+def _to_price(raw: str) -> float | None:
+    """``'1.299,90'`` → ``1299.9`` (``.`` thousands, ``,`` decimal)."""
     try:
-        return float(raw)
+        return float(raw.translate(_PRICE_TRANSLATION))
     except ValueError:
         return None
 
 
+def _parse_price_list(raws: Iterable[str]) -> tuple[float | None, float | None]:
+    """Return ``(current, original)`` from raw price strings in page order.
+
+    Only the first two parseable prices matter, so *raws* (typically a lazy
+    ``finditer`` stream) is consumed no further than that.  When the first
+    exceeds the second it is the struck-through original price.
+    """
+    first: float | None = None
+    for raw in raws:
+        price = _to_price(raw)
+        if price is None:
+            continue
+        if first is None:
+            first = price
+            continue
+        if first > price:
+            return price, first
+        return first, None
+    return first, None
+
+
 def _clean(text: str | None) -> str | None:
     """Strip and normalise whitespace; return ``None`` for empty."""
     if text is None:
         return None
-    cleaned = " ".join(text.split()).strip()
-    return cleaned or None
+    # ``str.split()`` with no argument already drops leading/trailing runs,
+    # and split/join is ~4x quicker here than ``re.sub(r"\s+", " ", …)``.
+    return " ".join(text.split()) or None
 
 
 # ── Public parsers ──────────────────────────────────────────────────────────
 
 
-def parse_listing_urls_from_page(html: str | Tag) -> list[str]:
+def parse_listing_urls_from_page(
+    html: str | bytes | Tag,
+    encoding: str | None = _DEFAULT_ENCODING,
+) -> list[str]:
     """Extract product detail URLs from a category / search / profile page.
 
     Looks for anchor tags whose ``href`` matches ``/urun/…`` pattern.
@@ -82,31 +447,96 @@ def parse_listing_urls_from_page(html: str | Tag) -> list[str]:
 
     Parameters
     ----------
-    html : str | Tag
+    html : str | bytes | Tag
         Rendered HTML of a listing page.
+    encoding : str | None
+        Encoding of ``bytes`` input. Default ``"utf-8"``; ``None`` lets
+        BeautifulSoup detect it.
 
     Returns
     -------
     list[str]
         Deduplicated listing URLs (relative paths starting with ``/urun/``).
     """
-    soup = _to_soup(html)
-    seen: set[str] = set()
-    urls: list[str] = []
+    hrefs = None
+    if isinstance(html, (bytes, bytearray)) and encoding is not None:
+        html = bytes(html).decode(encoding, errors="replace")
+    if isinstance(html, str) and _lxml_html is not None:
+        # Fast path: only hrefs are needed, so skip building a bs4 tree and
+        # let libxml2 evaluate the selection in C.
+        hrefs = _lxml_hrefs(html)
+    if hrefs is None:
+        soup = _to_soup(html, strainer=_LISTING_STRAINER, encoding=encoding)
+        hrefs = [a["href"] for a in soup.find_all("a", href=_LISTING_HREF_RE)]
+
+    return _listing_paths(hrefs)
+
+
+def parse_listing_urls_from_page_stream(
+    html: str | bytes | Iterable[str | bytes],
+    encoding: str | None = _DEFAULT_ENCODING,
+) -> list[str]:
+    """Streaming variant of :func:`parse_listing_urls_from_page`.
+
+    Feeds the page to lxml's incremental ``HTMLPullParser`` in chunks and
+    collects ``<a href>`` values as their start tags arrive, clearing every
+    finished element on the way.  Memory stays proportional to the open
+    element stack plus the URLs found, instead of the whole DOM — useful
+    for very long category / profile pages, or response bodies consumed
+    straight from ``iter_content()`` / an open file.
 
-    for a in soup.find_all("a", href=True):
-        href = a["href"]
-        if "/urun/" in href:
-            # Normalise: strip domain if present
-            if href.startswith("http"):
-                # keep path only
-                from urllib.parse import urlparse
+    Parameters
+    ----------
+    html : str | bytes | Iterable[str | bytes]
+        The page, or an iterable of its chunks (all ``str`` or all
+        ``bytes``).
+    encoding : str | None
+        Encoding of ``bytes`` input. Default ``"utf-8"``; ``None`` lets
+        libxml2 detect it.
 
-                href = urlparse(href).path
-            if href not in seen:
-                seen.add(href)
-                urls.append(href)
-    return urls
+    Returns
+    -------
+    list[str]
+        Same result as :func:`parse_listing_urls_from_page`.
+    """
+    if isinstance(html, (str, bytes, bytearray)):
+        chunks: Iterable[str | bytes] = (
+            html[i:i + _STREAM_CHUNK_SIZE]
+            for i in range(0, len(html), _STREAM_CHUNK_SIZE)
+        )
+    else:
+        chunks = html
+
+    if _lxml_etree is None:
+        chunks = list(chunks)
+        if not chunks:
+            return []
+        joined = (b"" if isinstance(chunks[0], (bytes, bytearray)) else "").join(chunks)
+        return parse_listing_urls_from_page(joined, encoding)
+
+    # Only ``<a>`` start events reach Python, so the per-element cost stays
+    # in C; between chunks everything left of the current parse position is
+    # pruned (see ``_prune_before``).
+    parser = _lxml_etree.HTMLPullParser(events=("start",), tag="a", encoding=encoding)
+    hrefs: list[str] = []
+
+    def drain() -> None:
+        el = None
+        for _, el in parser.read_events():
+            href = el.get("href")
+            if href is not None:
+                hrefs.append(href)
+        if el is not None:
+            _prune_before(el)
+
+    for chunk in chunks:
+        if chunk:
+            parser.feed(chunk)
+            drain()
+    with contextlib.suppress(_lxml_etree.XMLSyntaxError):  # nothing was fed
+        parser.close()
+    drain()
+    return _listing_paths(hrefs)
 
 
 def extract_listing_id_from_url(url: str) -> str | None:
@@ -115,26 +545,272 @@ def extract_listing_id_from_url(url: str) -> str | None:
     ``/urun/apple-bej-telefon-kilifi-yeni-etiketli-iphonelcase-442885461``
     → ``'442885461'``
     """
-    m = _ID_FROM_URL_RE.search(url.rstrip("/"))
-    return m.group(1) if m else None
+    # Plain str ops: the id is whatever follows the last "-", so there is
+    # exactly one candidate and no need to enter the regex engine.
+    slug = url.rstrip("/")
+    if slug.endswith("\n"):  # like ``$``, tolerate one trailing newline
+        slug = slug[:-1]
+    tail = slug[slug.rfind("-") + 1:] if "-" in slug else ""
+    # ``isdecimal`` is exactly the set ``\d`` matches for ``str`` patterns
+    if len(tail) >= _MIN_LISTING_ID_LEN and tail.isdecimal():
+        return tail
+    return None
 
 
-def parse_product_detail(html: str | Tag, url: str = "") -> dict[str, Any]:
+def parse_product_detail(
+    html: str | bytes | Tag,
+    url: str = "",
+    *,
+    encoding: str | None = _DEFAULT_ENCODING,
+) -> dict[str, Any]:
     """Parse a rendered product detail page into a flat dict.
 
     Parameters
     ----------
-    html : str | Tag
+    html : str | bytes | Tag
         Full rendered HTML of a ``/urun/…`` page.
     url : str
         The page URL (used for id extraction and stored in output).
+    encoding : str | None
+        Encoding of ``bytes`` input. Default ``"utf-8"``; ``None`` lets
+        BeautifulSoup detect it.
 
     Returns
     -------
     dict
         Keys are column names matching ``configs/features.yaml``.
     """
-    soup = _to_soup(html)
+    soup = _to_soup(html, encoding=encoding)
+    page_text, page_lines = _page_texts(soup)
+    return _parse_detail_fields(soup, url, page_text, page_lines)
+
+
+def parse_product_detail_cached(
+    html: str | bytes | Tag,
+    url: str = "",
+    *,
+    encoding: str | None = _DEFAULT_ENCODING,
+) -> dict[str, Any]:
+    """``parse_product_detail`` memoised on the page content.
+
+    Retries and backfills often fetch byte-identical pages; hashing the
+    HTML (xxh3 when :pypi:`xxhash` is installed, blake2b otherwise) is far
+    cheaper than building the tree again.  The key is
+    ``(content digest, url, encoding)`` — the URL feeds ``listing_id`` and
+    ``color`` — and only the 16-byte digest is kept, never the page itself.
+    The most recent ``4096`` records are retained; each call returns a copy,
+    so callers may mutate the result.  ``Tag`` inputs bypass the cache.
+    """
+    if isinstance(html, Tag):
+        return parse_product_detail(html, url, encoding=encoding)
+
+    key = (_content_digest(html), url, encoding)
+    with _PARSE_CACHE_LOCK:
+        record = _PARSE_CACHE.get(key)
+        if record is not None:
+            _PARSE_CACHE.move_to_end(key)
+    if record is None:
+        record = parse_product_detail(html, url, encoding=encoding)
+        with _PARSE_CACHE_LOCK:
+            _PARSE_CACHE[key] = record
+            if len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+                _PARSE_CACHE.popitem(last=False)
+    # Every value is immutable except the ``_parse_errors`` list
+    return {**record, "_parse_errors": list(record["_parse_errors"])}
+
+
+def clear_parse_cache() -> None:
+    """Drop every record memoised by :func:`parse_product_detail_cached`."""
+    with _PARSE_CACHE_LOCK:
+        _PARSE_CACHE.clear()
+
+
+def parse_product_details_batch(
+    htmls: Sequence[str | bytes | Tag],
+    urls: Sequence[str] | None = None,
+    *,
+    encoding: str | None = _DEFAULT_ENCODING,
+    chunk_size: int = _BATCH_CHUNK_SIZE,
+) -> pd.DataFrame:
+    """Parse many product pages into one DataFrame (one row per page).
+
+    Produces exactly what ``parse_product_detail`` would for every page,
+    with the same column order.  Pages are processed in chunks of
+    *chunk_size*: the literal badge fields (condition, shipping, sold) are
+    evaluated column-wise with pandas substring kernels over the chunk's
+    page texts — Arrow-backed when pyarrow is installed — instead of once
+    per page.  Regex fields stay on Python ``re``: Arrow's RE2 engine treats
+    ``\\s`` / ``\\d`` as ASCII-only, which would change matches on Turkish
+    pages (e.g. non-breaking spaces before "TL").
+
+    Parameters
+    ----------
+    htmls : Sequence[str | bytes | Tag]
+        Rendered product pages.
+    urls : Sequence[str] | None
+        Page URLs aligned with *htmls* (``None`` → no URLs).
+    encoding : str | None
+        Encoding of ``bytes`` inputs, as for ``parse_product_detail``.
+    chunk_size : int
+        Pages parsed (and held in memory as trees) at a time.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per input page; an empty frame for empty input.
+    """
+    import numpy as np
+    import pandas as pd
+
+    if urls is None:
+        urls = [""] * len(htmls)
+    if len(urls) != len(htmls):
+        raise ValueError(f"Got {len(htmls)} pages but {len(urls)} urls")
+
+    try:
+        import pyarrow  # noqa: F401
+
+        string_dtype = "string[pyarrow]"
+    except ImportError:  # pragma: no cover
+        string_dtype = "string"
+
+    def _first_literal(texts: pd.Series, literals: tuple[str, ...]) -> np.ndarray:
+        hits = [
+            texts.str.contains(lit, regex=False).to_numpy(dtype=bool, na_value=False)
+            for lit in literals
+        ]
+        return np.select(hits, np.array(literals, dtype=object), default=None)
+
+    records: list[dict[str, Any]] = []
+    for start in range(0, len(htmls), max(1, chunk_size)):
+        soups = [
+            _to_soup(html, encoding=encoding)
+            for html in htmls[start : start + chunk_size]
+        ]
+        texts = [_page_texts(soup) for soup in soups]
+
+        page_texts = pd.Series([t for t, _ in texts], dtype=string_dtype)
+        conditions = _first_literal(page_texts, _CONDITIONS)
+        shipping = _first_literal(page_texts, _SHIPPING_PATTERNS)
+        sold = np.logical_or.reduce(
+            [
+                page_texts.str.contains(lit, regex=False).to_numpy(dtype=bool, na_value=False)
+                for lit in _SOLD_INDICATORS
+            ]
+        )
+
+        for i, soup in enumerate(soups):
+            badges = {
+                "condition": conditions[i],
+                "shipping_info": shipping[i],
+                "is_sold": bool(sold[i]),
+            }
+            page_text, page_lines = texts[i]
+            records.append(
+                _parse_detail_fields(soup, urls[start + i], page_text, page_lines, badges)
+            )
+        del soups, texts
+
+    return pd.DataFrame.from_records(records)
+
+
+def parse_product_details_parallel(
+    htmls: Sequence[str | bytes],
+    urls: Sequence[str] | None = None,
+    *,
+    workers: int | None = None,
+    encoding: str | None = _DEFAULT_ENCODING,
+    chunksize: int = _PARALLEL_CHUNK_SIZE,
+) -> list[dict[str, Any]]:
+    """Parse many product pages across processes.
+
+    Parsing is CPU-bound pure Python (tree building, regex, tree walks), so
+    threads would serialise on the GIL; a ``ProcessPoolExecutor`` scales
+    with cores instead.  Compiled regexes and strainers are module globals:
+    forked workers inherit them and spawned ones build them once on import,
+    so no per-task setup is needed.
+
+    Parameters
+    ----------
+    htmls : Sequence[str | bytes]
+        Rendered product pages (soups are not accepted — they pickle poorly).
+    urls : Sequence[str] | None
+        Page URLs aligned with *htmls* (``None`` → no URLs).
+    workers : int | None
+        Worker processes; ``None`` → ``os.cpu_count()``.  With one worker
+        (or a single page) everything runs in-process.
+    encoding : str | None
+        Encoding of ``bytes`` inputs, as for ``parse_product_detail``.
+    chunksize : int
+        Pages sent to a worker per task, amortising IPC.  Default ``64``.
+
+    Returns
+    -------
+    list[dict]
+        ``parse_product_detail`` records, in input order.
+    """
+    if urls is None:
+        urls = [""] * len(htmls)
+    if len(urls) != len(htmls):
+        raise ValueError(f"Got {len(htmls)} pages but {len(urls)} urls")
+
+    workers = min(workers or os.cpu_count() or 1, len(htmls))
+    tasks = zip(htmls, urls, [encoding] * len(htmls), strict=True)
+    if workers <= 1:
+        return [_parse_one(task) for task in tasks]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_parse_one, tasks, chunksize=max(1, chunksize)))
+
+
+# ── Internal parsing helpers ────────────────────────────────────────────────
+
+
+def _parse_one(task: tuple[str | bytes, str, str | None]) -> dict[str, Any]:
+    """Picklable worker entry point for ``parse_product_details_parallel``."""
+    html, url, encoding = task
+    return parse_product_detail(html, url, encoding=encoding)
+
+
+def _page_texts(soup: BeautifulSoup | Tag) -> tuple[str, str]:
+    """Return ``(page_text, page_lines)`` from a single walk of the tree.
+
+    Equivalent to ``soup.get_text()`` and ``soup.get_text(separator="\\n")``;
+    the helpers get both joins instead of each calling ``get_text`` (a full
+    tree traversal) themselves.
+    """
+    strings = list(soup.strings)
+    return "".join(strings), "\n".join(strings)
+
+
+def _lower_aligned(text: str) -> str:
+    """Lower-case *text* keeping every character at the same index.
+
+    ``"İ".lower()`` is two code points; mapping it to ``"ı"`` first keeps
+    the result index-aligned with *text* (and ``"ı"`` is case-insensitively
+    equal to it for the size pattern, just like the original).
+    """
+    return text.replace("İ", "ı").lower()
+
+
+def _parse_detail_fields(
+    soup: BeautifulSoup | Tag,
+    url: str,
+    page_text: str,
+    page_lines: str,
+    badges: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Build the ``parse_product_detail`` record from a parsed page.
+
+    *badges* carries ``condition`` / ``shipping_info`` / ``is_sold`` when the
+    caller already computed them (batch parsing); otherwise they are
+    detected here with :func:`_scan_page_text`.
+    """
+    if badges is None:
+        badges = _scan_page_text(page_text)
+
     errors: list[str] = []
     data: dict[str, Any] = {
         "url": url or None,
@@ -153,24 +829,26 @@ def parse_product_detail(html: str | Tag, url: str = "") -> dict[str, Any]:
     data["title"] = _parse_title(soup)
 
     # ── Price ────────────────────────────────────────────────────────────
-    prices = _parse_prices(soup)
-    data["price"] = prices.get("current")
-    data["original_price"] = prices.get("original")
-    data["has_discount"] = prices.get("original") is not None and (
-        prices.get("original", 0) > prices.get("current", 0)
+    prices = _parse_prices(soup, page_lines)
+    current = prices["current"]
+    original = prices["original"]
+    data["price"] = current
+    data["original_price"] = original
+    data["has_discount"] = (
+        original is not None and current is not None and original > current
     )
 
     # ── Condition ────────────────────────────────────────────────────────
-    data["condition"] = _parse_condition(soup)
+    data["condition"] = badges["condition"]
 
     # ── Color ────────────────────────────────────────────────────────────
     data["color"] = _parse_color(soup, url)
 
     # ── Size ─────────────────────────────────────────────────────────────
-    data["size"] = _parse_size(soup)
+    data["size"] = _parse_size(soup, page_text, _lower_aligned(page_text))
 
     # ── Description ──────────────────────────────────────────────────────
-    desc = _parse_description(soup)
+    desc = _parse_description(soup, page_lines)
     data["description_text"] = desc
     data["description_length"] = len(desc) if desc else 0
     data["description_word_count"] = len(desc.split()) if desc else 0
@@ -179,12 +857,12 @@ def parse_product_detail(html: str | Tag, url: str = "") -> dict[str, Any]:
     data["photo_count"] = _parse_photo_count(soup)
 
     # ── Engagement ───────────────────────────────────────────────────────
-    engagement = _parse_engagement(soup)
+    engagement = _parse_engagement(soup, page_text)
     data["like_count"] = engagement.get("likes")
     data["comment_count"] = engagement.get("comments")
 
     # ── Shipping ─────────────────────────────────────────────────────────
-    data["shipping_info"] = _parse_shipping(soup)
+    data["shipping_info"] = badges["shipping_info"]
     data["shipping_buyer_pays"] = _is_buyer_pays(data["shipping_info"])
 
     # ── Seller ───────────────────────────────────────────────────────────
@@ -193,7 +871,7 @@ def parse_product_detail(html: str | Tag, url: str = "") -> dict[str, Any]:
     data["seller_listing_count"] = seller.get("listing_count")
 
     # ── Sold status ──────────────────────────────────────────────────────
-    data["is_sold"] = _detect_sold(soup)
+    data["is_sold"] = badges["is_sold"]
 
     # ── Parse quality ────────────────────────────────────────────────────
     # Count how many key fields are None → quality signal
@@ -206,9 +884,6 @@ def parse_product_detail(html: str | Tag, url: str = "") -> dict[str, Any]:
     return data
 
 
-# ── Internal parsing helpers ────────────────────────────────────────────────
-
-
 def _parse_breadcrumbs(soup: BeautifulSoup) -> dict[str, str | None]:
     """Extract category hierarchy from breadcrumb navigation."""
     result: dict[str, str | None] = {"category": None, "subcategory": None}
@@ -217,20 +892,18 @@ def _parse_breadcrumbs(soup: BeautifulSoup) -> dict[str, str | None]:
     # We want the 2nd-to-last and 3rd-to-last levels
     # Try: look for breadcrumb-like link sequences or text
     bc_links = []
-    for a in soup.find_all("a"):
+    # breadcrumb links typically point to dolap.com/ category paths
+    for a in soup.find_all("a", href=_SITE_HREF_RE):
+        href = a["href"]
+        if href.startswith("/") and ("/urun/" in href or "/profil/" in href):
+            continue
         text = _clean(a.get_text())
-        href = a.get("href", "")
-        if text and href and text not in ("Ana Sayfa", "GİRİŞ YAP", "Markalar"):
-            # breadcrumb links typically point to dolap.com/ category paths
-            if href.startswith("https://dolap.com/") or (
-                href.startswith("/") and "/urun/" not in href and "/profil/" not in href
-            ):
-                bc_links.append(text)
+        if text and text not in ("Ana Sayfa", "GİRİŞ YAP", "Markalar"):
+            bc_links.append(text)
 
     # The page typically shows: Ana Sayfa > MainCat > SubCat > SubSubCat > Brand
     # We'll try to detect the breadcrumb by finding "KATEGORİLER" section
     # or by checking the page structure
-    breadcrumb_text = soup.get_text()
 
     # Fallback: try to extract from URL slug
     # /urun/{brand}-{color}-{category-slug}-{condition}-{user}-{id}
@@ -248,8 +921,6 @@ def _parse_brand(soup: BeautifulSoup, breadcrumbs: dict) -> str | None:
     # Strategy 1: The brand name appears as a standalone heading / title
     # On Dolap product pages, the brand appears prominently
     # Look for the main product info section
-    page_text = soup.get_text(separator="\n")
-
     # Look for pattern: Brand name near "Telefon Kılıfı" or category name
     # The product page shows: "Apple Telefon Kılıfı" or "Zara Kazak"
     for h in soup.find_all(["h1", "h2", "h3"]):
@@ -283,52 +954,19 @@ def _parse_title(soup: BeautifulSoup) -> str | None:
     return None
 
 
-def _parse_prices(soup: BeautifulSoup) -> dict[str, float | None]:
+def _parse_prices(soup: BeautifulSoup, page_lines: str) -> dict[str, float | None]:
     """Extract current and (optional) original price."""
     result = {"current": None, "original": None}
 
-    # Find all price-like text in the page
-    page_text = soup.get_text(separator="\n")
-    price_matches = _PRICE_RE.findall(page_text)
-
-    if price_matches:
-        # Parse all found prices
-        prices = []
-        for raw in price_matches:
-            p = raw.replace(".", "").replace(",", ".")
-            try:
-                prices.append(float(p))
-            except ValueError:
-                continue
-
-        if len(prices) >= 2 and prices[0] > prices[1]:
-            # First price is original (strikethrough), second is current
-            result["original"] = prices[0]
-            result["current"] = prices[1]
-        elif len(prices) >= 1:
-            result["current"] = prices[0]
-
+    # Scan price-like text lazily — the scan stops after two valid prices
+    current, original = _parse_price_list(
+        m.group(1) for m in _PRICE_RE.finditer(page_lines)
+    )
+    result["current"] = current
+    result["original"] = original
     return result
 
 
-def _parse_condition(soup: BeautifulSoup) -> str | None:
-    """Detect condition badge text."""
-    conditions = [
-        "Yeni ve Etiketli",
-        "Yeni & Etiketli",
-        "Yeni",
-        "Az Kullanılmış",
-        "Çok Kullanılmış",
-        "Kullanılmış",
-        "Defolu",
-    ]
-    page_text = soup.get_text()
-    for cond in conditions:
-        if cond in page_text:
-            return cond
-    return None
-
-
 def _parse_color(soup: BeautifulSoup, url: str = "") -> str | None:
     """Extract colour from colour swatch or URL slug."""
     # Strategy 1: Look for colour label text (e.g. "Bej" next to swatch img)
@@ -360,51 +998,52 @@ def _parse_color(soup: BeautifulSoup, url: str = "") -> str | None:
     return None
 
 
-def _parse_size(soup: BeautifulSoup) -> str | None:
-    """Extract size from product details area."""
+def _parse_size(
+    soup: BeautifulSoup,
+    page_text: str,
+    page_text_lower: str | None = None,
+) -> str | None:
+    """Extract size from product details area.
+
+    *page_text_lower* (``_lower_aligned(page_text)``) lets plain ``str.find``
+    locate the only places a size match can start — "beden" or a digit or
+    two before "xl" — so the case-insensitive regex runs at a handful of
+    positions instead of over the whole page.
+    """
     # Size appears in product detail area for clothing items
-    # Common patterns: "S", "M", "L", "36", "38", "4XL / 48"
-    page_text = soup.get_text()
-    size_patterns = [
-        r"Beden[:\s]+([A-Z0-9/\s]+)",
-        r"(\d{1,2}XL\s*/\s*\d{2})",
-        r"Beden\s*:\s*(\S+)",
-    ]
-    for pattern in size_patterns:
-        m = re.search(pattern, page_text, re.IGNORECASE)
-        if m:
-            return _clean(m.group(1))
+    candidates = None
+    if page_text_lower is not None:
+        xl_starts = (
+            start
+            for pos in _find_all(page_text_lower, "xl")
+            for start in (pos - 2, pos - 1)
+            if start >= 0
+        )
+        candidates = sorted(
+            {*_find_all(page_text_lower, "beden"), *xl_starts}
+        )
+    m = _search_by_priority(_SIZE_RE, page_text, candidates)
+    if m:
+        return _clean(m.group(f"v{_alt_index(m)}"))
     return None
 
 
-def _parse_description(soup: BeautifulSoup) -> str | None:
+def _parse_description(soup: BeautifulSoup, page_lines: str) -> str | None:
     """Extract seller description text."""
     # The description is the free-text area written by the seller
     # On Dolap it appears below the product details
     # We look for longer text blocks that aren't navigation / boilerplate
-    page_text = soup.get_text(separator="\n")
-    lines = [_clean(line) for line in page_text.split("\n") if _clean(line)]
+    lines = [c for line in page_lines.split("\n") if (c := _clean(line))]
 
     # Heuristic: find text blocks that are descriptive (20+ chars)
     # and not navigation elements
-    skip_patterns = [
-        "KATEGORİLER", "BENZER ÜRÜNLER", "Popüler Aramalar",
-        "Dolap Hakkında", "Kol Çantası", "Kategoriler",
-        "Tanımlama bilgilerini", "Ödeme Seçenekleri",
-        "Yorum Yayınlanma", "PAYLAŞ", "Dolap Avantajları",
-    ]
     for line in lines:
         if not line or len(line) < 20:
             continue
-        if any(skip in line for skip in skip_patterns):
+        if _contains_any(_DESC_SKIP_AC, _DESC_SKIP, line):
             continue
         # Description is typically a sentence about the product
-        if any(kw in line.lower() for kw in [
-            "kılıf", "elbise", "kazak", "mont", "pantolon", "ayakkabı",
-            "çanta", "gömlek", "etek", "tshirt", "bot", "çizme",
-            "kullanılmamış", "sıfır", "orjinal", "modelleri", "mevcut",
-            "renk", "beden", "kargo", "yeni", "tertemiz",
-        ]):
+        if _contains_any(_DESC_KEYWORDS_AC, _DESC_KEYWORDS, line.lower()):
             return line
 
     return None
@@ -412,64 +1051,47 @@ def _parse_description(soup: BeautifulSoup) -> str | None:
 
 def _parse_photo_count(soup: BeautifulSoup) -> int:
     """Count product images (carousel slides or thumbnails)."""
+    # One tree walk; both strategies reuse the same <img> list
+    imgs = soup.find_all("img")
+
     # Product images are typically in img tags with "product" in src
-    count = 0
-    seen_srcs: set[str] = set()
-    for img in soup.find_all("img"):
-        src = img.get("src", "")
-        if "product" in src or "dlp_" in src or "dsmcdn" in src:
-            if src not in seen_srcs:
-                seen_srcs.add(src)
-                count += 1
+    srcs = {
+        src
+        for src in (img.get("src", "") for img in imgs)
+        if any(tok in src for tok in _PHOTO_SRC_TOKENS)
+    }
+    if srcs:
+        return len(srcs)
+
     # Fallback: alt text pattern "Brand Kategori" repeated = carousel
-    if count == 0:
-        alt_pattern_count = 0
-        for img in soup.find_all("img"):
-            alt = img.get("alt", "")
-            if alt and ("Telefon" in alt or "Kazak" in alt or "Elbise" in alt):
-                alt_pattern_count += 1
-        count = alt_pattern_count
-    return count
+    return sum(
+        1
+        for alt in (img.get("alt", "") for img in imgs)
+        if alt and any(tok in alt for tok in _PHOTO_ALT_TOKENS)
+    )
 
 
-def _parse_engagement(soup: BeautifulSoup) -> dict[str, int | None]:
+def _parse_engagement(soup: BeautifulSoup, page_text: str) -> dict[str, int | None]:
     """Extract like and comment counts."""
     result = {"likes": None, "comments": None}
-    page_text = soup.get_text()
 
     # Like pattern: "32 Beğeni"
-    like_match = re.search(r"(\d+)\s*Beğeni", page_text)
+    like_match = _LIKES_RE.search(page_text)
     if like_match:
         result["likes"] = int(like_match.group(1))
 
     # Comment pattern: "Yorumlar (0)" or "0 Yorum"
-    comment_match = re.search(r"Yorumlar?\s*\((\d+)\)", page_text)
+    comment_match = _COMMENTS_PAREN_RE.search(page_text)
     if comment_match:
         result["comments"] = int(comment_match.group(1))
     else:
-        comment_match2 = re.search(r"(\d+)\s*Yorum", page_text)
+        comment_match2 = _COMMENTS_RE.search(page_text)
         if comment_match2:
             result["comments"] = int(comment_match2.group(1))
 
     return result
 
 
-def _parse_shipping(soup: BeautifulSoup) -> str | None:
-    """Extract shipping info text."""
-    page_text = soup.get_text()
-    shipping_patterns = [
-        "Alıcı Ödemeli Kargo",
-        "Alıcı Öder",
-        "Ücretsiz Kargo",
-        "Satıcı Öder",
-        "Kargo Dahil",
-    ]
-    for pattern in shipping_patterns:
-        if pattern in page_text:
-            return pattern
-    return None
-
-
 def _is_buyer_pays(shipping_info: str | None) -> bool:
     """Return True if the buyer pays for shipping."""
     if not shipping_info:
@@ -483,32 +1105,18 @@ def _parse_seller(soup: BeautifulSoup) -> dict[str, Any]:
     result: dict[str, Any] = {"username": None, "listing_count": None}
 
     # Seller appears as a link to /profil/{username} with (count)
-    for a in soup.find_all("a", href=True):
-        href = a.get("href", "")
-        if "/profil/" in href:
-            # Extract username from /profil/{username}
-            parts = href.rstrip("/").split("/profil/")
-            if len(parts) == 2 and parts[1]:
-                username = parts[1]
-                result["username"] = username
-
-                # Look for listing count in nearby text: "iphonelcase (1221)"
-                parent_text = a.parent.get_text() if a.parent else ""
-                count_match = re.search(r"\((\d+)\)", parent_text)
-                if count_match:
-                    result["listing_count"] = int(count_match.group(1))
-                break  # first seller link is the product seller
+    for a in soup.find_all("a", href=_PROFILE_HREF_RE):
+        # Extract username from /profil/{username}
+        parts = a["href"].rstrip("/").split("/profil/")
+        if len(parts) == 2 and parts[1]:
+            username = parts[1]
+            result["username"] = username
+
+            # Look for listing count in nearby text: "iphonelcase (1221)"
+            parent_text = a.parent.get_text() if a.parent else ""
+            count_match = _PAREN_COUNT_RE.search(parent_text)
+            if count_match:
+                result["listing_count"] = int(count_match.group(1))
+            break  # first seller link is the product seller
 
     return result
-
-
-def _detect_sold(soup: BeautifulSoup) -> bool:
-    """Return True if the listing is marked as sold."""
-    page_text = soup.get_text()
-    sold_indicators = [
-        "Satıldı",
-        "Bu ürün satılmıştır",
-        "SATILDI",
-        "sold",
-    ]
-    return any(indicator in page_text for indicator in sold_indicators)
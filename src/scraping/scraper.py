@@ -31,31 +31,56 @@ Usage::
 
 from __future__ import annotations
 
+import gzip
+import hashlib
 import json
+import os
+import queue
 import random
+import re
+import threading
 import time
-from datetime import datetime
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack, contextmanager, suppress
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
+from urllib.parse import urlparse
 
-import yaml
 from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import (
     NoSuchElementException,
     TimeoutException,
     WebDriverException,
 )
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover — optional speed-up
+    orjson = None
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover — Windows
+    fcntl = None
+
+try:
+    import undetected_chromedriver as uc
+except ImportError:  # pragma: no cover — optional (``stealth: undetected``)
+    uc = None
 
 from src.scraping.parsers import (
     extract_listing_id_from_url,
     parse_listing_urls_from_page,
     parse_product_detail,
 )
+from src.utils.config import load_config
 from src.utils.logger import get_logger
 
 
@@ -63,6 +88,112 @@ from src.utils.logger import get_logger
 
 _BASE_URL = "https://dolap.com"
 _DEFAULT_CONFIG = "configs/scraping.yaml"
+_DEFAULT_CACHE_DIR = ".cache/html"
+_DEFAULT_CACHE_TTL_HOURS = 24.0
+_DEFAULT_PROFILE_DIR = ".cache/chrome-profile"
+_MAX_PROFILE_SLOTS = 64
+_WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB JSONL write buffer
+_FLUSH_EVERY = 10  # records between JSONL flushes (matches progress logging)
+_FETCH_QUEUE_SIZE = 4  # rendered pages buffered between fetch and parse threads
+_DEFAULT_RECYCLE_EVERY = 200  # batch pages per Chrome session
+# "eager" returns from driver.get() at DOMContentLoaded instead of waiting
+# for every image / font / beacon; the explicit waits gate on real content.
+_DEFAULT_PAGE_LOAD_STRATEGY = "eager"
+_PAGE_LOAD_STRATEGIES = ("normal", "eager", "none")
+
+# Anti-detection strategies (``stealth`` in the config):
+#   basic       — hide ``navigator.webdriver`` only
+#   patches     — also patch the fingerprints Cloudflare's JS probes
+#   undetected  — drive Chrome through undetected-chromedriver (+ patches)
+_STEALTH_MODES = ("basic", "patches", "undetected")
+_DEFAULT_STEALTH = "patches"
+
+_WEBDRIVER_PATCH_JS = (
+    "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+)
+_STEALTH_PATCH_JS = _WEBDRIVER_PATCH_JS + """;
+Object.defineProperty(navigator, 'languages', {get: () => ['tr-TR', 'tr', 'en-US', 'en']});
+Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
+window.chrome = window.chrome || {runtime: {}};
+const _query = window.navigator.permissions && window.navigator.permissions.query;
+if (_query) {
+  window.navigator.permissions.query = (p) => p && p.name === 'notifications'
+    ? Promise.resolve({state: Notification.permission}) : _query(p);
+}
+for (const ctx of [window.WebGLRenderingContext, window.WebGL2RenderingContext]) {
+  if (!ctx) continue;
+  const getParameter = ctx.prototype.getParameter;
+  ctx.prototype.getParameter = function (p) {
+    if (p === 37445) return 'Intel Inc.';               // UNMASKED_VENDOR_WEBGL
+    if (p === 37446) return 'Intel Iris OpenGL Engine'; // UNMASKED_RENDERER_WEBGL
+    return getParameter.call(this, p);
+  };
+}
+"""
+
+# Product cards on category pages; counted in-browser so only an int travels
+_PRODUCT_LINK_COUNT_JS = "return document.querySelectorAll('a[href*=\"/urun/\"]').length;"
+_LAZY_LOAD_TIMEOUT = 3  # seconds to wait for more cards after scrolling
+
+# ``outerHTML`` of the first node matching ``arguments[0]`` (``null`` if none)
+_OUTER_HTML_JS = (
+    "const el = document.querySelector(arguments[0]);"
+    " return el ? el.outerHTML : null;"
+)
+
+# Markers checked against the live DOM (see ``_page_has``)
+# Cloudflare interstitials: block page, error pages, JS / managed challenge
+_CF_MARKERS = (
+    "Attention Required", "cf-error", "Just a moment",
+    "challenge-platform", "cf-chl-",
+)
+_CF_BLOCK_MARKERS = ("Attention Required",)
+# Titles of Cloudflare interstitials (challenge, block, error pages)
+_CF_TITLE_MARKERS = ("Just a moment", "Attention Required", "Cloudflare", "Access denied")
+# Cloudflare error pages only name the status: "dolap.com | 521: Web server is
+# down", "Error 1020", … — the full-document scan (``cf-error``) confirms.
+_CF_ERROR_TITLE = re.compile(r"\b[45]\d\d: |\bError 1\d{3}\b")
+_DETAIL_READY_MARKERS = ("TL", "Beğeni")  # price + like counter rendered
+
+# ``arguments[0]``: markers; ``arguments[1]``: require all (else any).  Runs in
+# the browser, so only a boolean crosses the WebDriver wire instead of the
+# serialised ``page_source``.  "Any" compiles the markers into one
+# alternation, so the document is scanned once however many markers exist.
+_PAGE_HAS_JS = (
+    "const h = document.documentElement.outerHTML;"
+    " const ms = arguments[0];"
+    " if (arguments[1]) return ms.every(m => h.includes(m));"
+    " const esc = ms.map(m => m.replace(/[.*+?^${}()|[\\]\\\\]/g, '\\\\$&'));"
+    " return new RegExp(esc.join('|')).test(h);"
+)
+
+# Tab dispatch for ``scrape_listings_batch_tabs``: flag the *current*
+# document as stale, then navigate.  ``location.href = …`` only replaces the
+# document once the new navigation commits, and every committed document
+# gets a fresh ``window`` — so until then the flag is still visible.
+_TAB_DISPATCH_JS = (
+    "window.__dolapStale = true;"
+    " window.location.href = arguments[0];"
+)
+# Tab readiness: the same signal as ``_wait_for_product_detail``, checked
+# only on the document the dispatch above navigated to.
+_TAB_READY_JS = (
+    "if (window.__dolapStale || document.readyState === 'loading'"
+    " || document.location.href === 'about:blank') return false;"
+    " const h = document.documentElement.outerHTML;"
+    " return arguments[0].every(m => h.includes(m));"
+)
+_TAB_POLL_INTERVAL = 0.25  # seconds between round-robin polls
+
+# Requests Chrome drops before they hit the wire (CDP ``Network.setBlockedURLs``).
+# Parsers only read the DOM — ``<img src>`` attributes survive without the
+# image bytes — so media, fonts and trackers are pure overhead.
+_DEFAULT_BLOCKED_URL_PATTERNS = (
+    "*.jpg", "*.jpeg", "*.png", "*.webp", "*.gif", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.mp4", "*.webm",
+    "*google-analytics*", "*googletagmanager*", "*doubleclick*",
+    "*facebook.net*", "*hotjar*",
+)
 
 _USER_AGENTS = [
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -83,11 +214,129 @@ _USER_AGENTS = [
 
 def load_scraping_config(path: str | Path = _DEFAULT_CONFIG) -> dict:
     """Load and return the scraping section of the YAML config."""
-    with open(path, "r", encoding="utf-8") as fh:
-        cfg = yaml.safe_load(fh)
+    cfg = load_config(path)
     return cfg.get("scraping", cfg)
 
 
+def _dump_record(data: dict[str, Any]) -> bytes:
+    """Serialise a listing dict as one JSONL line (``_parse_errors`` dropped)."""
+    record = {k: v for k, v in data.items() if k != "_parse_errors"}
+    if orjson is not None:
+        return orjson.dumps(record) + b"\n"
+    return (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+@contextmanager
+def _jsonl_writer(
+    path: str | Path | None,
+) -> Iterator[Callable[[dict[str, Any]], None]]:
+    """Open *path* for appending JSONL records; yield a ``write(record)``.
+
+    Writes go through a ``_WRITE_BUFFER_SIZE`` buffer that is flushed every
+    ``_FLUSH_EVERY`` records, so the file stays close to progress if the
+    run dies midway.  With ``path=None`` the writer discards records.
+    """
+    if path is None:
+        yield lambda _record: None
+        return
+
+    out = Path(path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    with open(out, "ab", buffering=_WRITE_BUFFER_SIZE) as fh:
+        written = 0
+
+        def write(record: dict[str, Any]) -> None:
+            nonlocal written
+            fh.write(_dump_record(record))
+            written += 1
+            if written % _FLUSH_EVERY == 0:
+                fh.flush()
+
+        yield write
+
+
+def _cdp_cookie(cookie: dict[str, Any]) -> dict[str, Any]:
+    """Convert a WebDriver cookie dict to a CDP ``Network.CookieParam``."""
+    param = {
+        key: cookie[key]
+        for key in ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite")
+        if key in cookie
+    }
+    if "expiry" in cookie:
+        param["expires"] = cookie["expiry"]
+    return param
+
+
+class _Page(NamedTuple):
+    """Rendered detail page and when it was fetched (naive UTC).
+
+    For cache hits *fetched_at* is the original fetch, not the replay, so
+    records never pass day-old like counts or sold flags off as fresh.
+    """
+
+    html: str
+    fetched_at: datetime
+
+
+# ── Rate limiting ───────────────────────────────────────────────────────────
+
+
+class _TokenBucket:
+    """Thread-safe token bucket: at most *rate* requests/s, bursts of *capacity*.
+
+    Callers only wait when the bucket is empty, and only as long as it
+    takes to refill one token — time spent loading the previous page
+    already counts towards the politeness budget.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        if rate <= 0 or capacity < 1:
+            raise ValueError(f"Need rate > 0 and capacity >= 1, got {rate}, {capacity}")
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self) -> bool:
+        """Take a token if one is available, without waiting."""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+    def acquire(self) -> None:
+        """Take a token, sleeping just long enough for one to be available."""
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+# One bucket per host per process, shared by every scraper (threads, tabs,
+# parallel batches) so politeness bounds the *aggregate* request rate.
+_LIMITERS: dict[str, _TokenBucket] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def _limiter_for(host: str, rate: float, capacity: float) -> _TokenBucket:
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(host)
+        if limiter is None:
+            limiter = _LIMITERS[host] = _TokenBucket(rate, capacity)
+        return limiter
+
+
 # ── Main scraper class ──────────────────────────────────────────────────────
 
 
@@ -100,6 +349,10 @@ class DolapScraper:
         Path to ``scraping.yaml``.
     headless : bool
         Run Chrome without a visible window.
+    cache_enabled : bool, optional
+        Serve rendered detail pages from the on-disk HTML cache
+        (``cache_dir``, entries younger than ``cache_ttl_hours``).
+        ``None`` (default) defers to ``cache_enabled`` in the config.
     """
 
     # -- lifecycle --------------------------------------------------------
@@ -108,7 +361,9 @@ class DolapScraper:
         self,
         config_path: str | Path = _DEFAULT_CONFIG,
         headless: bool = True,
+        cache_enabled: bool | None = None,
     ) -> None:
+        self._config_path = config_path
         self.cfg = load_scraping_config(config_path)
         self.headless = headless
         self.logger = get_logger("scraper")
@@ -117,16 +372,75 @@ class DolapScraper:
         # Rate limiting params
         self._delay_min: float = self.cfg.get("delay", {}).get("min_seconds", 1.5)
         self._delay_max: float = self.cfg.get("delay", {}).get("max_seconds", 3.5)
+        # Default rate = one request per mean delay, i.e. the old serial pace
+        rate = self.cfg.get("rate_per_sec") or 2.0 / (self._delay_min + self._delay_max)
+        self._limiter = _limiter_for(
+            urlparse(self.cfg.get("base_url", _BASE_URL)).netloc or _BASE_URL,
+            float(rate),
+            float(self.cfg.get("rate_burst", 2)),
+        )
         self._max_retries: int = self.cfg.get("max_retries", 3)
+        # Restart Chrome every N batch pages to shed leaked renderer memory
+        # (``0`` disables recycling)
+        self._recycle_every: int = int(
+            self.cfg.get("recycle_driver_every", _DEFAULT_RECYCLE_EVERY)
+        )
         self._backoff_factor: float = self.cfg.get("retry_backoff_factor", 2.0)
         self._timeout: int = self.cfg.get("timeout_seconds", 30)
+        self._page_load_strategy: str = self.cfg.get(
+            "page_load_strategy", _DEFAULT_PAGE_LOAD_STRATEGY
+        )
+        if self._page_load_strategy not in _PAGE_LOAD_STRATEGIES:
+            raise ValueError(
+                f"page_load_strategy must be one of {_PAGE_LOAD_STRATEGIES}, "
+                f"got {self._page_load_strategy!r}"
+            )
+        self._page_load_timeout: int = self.cfg.get(
+            "page_load_timeout_seconds", self._timeout
+        )
+        self._stealth: str = self.cfg.get("stealth", _DEFAULT_STEALTH)
+        if self._stealth not in _STEALTH_MODES:
+            raise ValueError(
+                f"stealth must be one of {_STEALTH_MODES}, got {self._stealth!r}"
+            )
+        # Subtrees serialised for parsing (``None`` → whole ``page_source``).
+        # Listing pages only need their ``<a>`` tags, all inside ``<body>``;
+        # detail parsing also reads ``<head>`` (``<title>``, ``og:`` meta), so
+        # it keeps the full document unless configured otherwise.
+        self._listing_container: str | None = self.cfg.get(
+            "listing_container_selector", "body"
+        )
+        self._detail_container: str | None = self.cfg.get(
+            "detail_container_selector"
+        )
+        # ``[]`` in the config disables blocking
+        self._blocked_url_patterns: list[str] = list(
+            self.cfg.get("block_resource_patterns", _DEFAULT_BLOCKED_URL_PATTERNS)
+        )
+
+        # HTML cache (rendered detail pages, gzip, keyed by URL)
+        if cache_enabled is None:
+            cache_enabled = bool(self.cfg.get("cache_enabled", True))
+        self._cache_enabled = cache_enabled
+        self._cache_dir = Path(self.cfg.get("cache_dir", _DEFAULT_CACHE_DIR))
+        self._cache_ttl: float = (
+            float(self.cfg.get("cache_ttl_hours", _DEFAULT_CACHE_TTL_HOURS)) * 3600
+        )
+
+        # Persistent Chrome profiles (keep the Cloudflare clearance cookie);
+        # ``profile_dir: ""`` in the config disables them.
+        profile_dir = self.cfg.get("profile_dir", _DEFAULT_PROFILE_DIR)
+        self._profile_root = Path(profile_dir) if profile_dir else None
+        self._profile_lock: ExitStack | None = None  # owns the lock file while a slot is held
 
         # Stats
         self._stats: dict[str, int] = {
             "pages_loaded": 0,
             "listings_scraped": 0,
+            "cache_hits": 0,
             "errors": 0,
         }
+        self._stats_lock = threading.Lock()
 
     def __enter__(self) -> "DolapScraper":
         self.start()
@@ -141,7 +455,14 @@ class DolapScraper:
             return
 
         self.logger.info("Starting Selenium Chrome WebDriver", headless=self.headless)
-        options = Options()
+        stealth = self._stealth
+        if stealth == "undetected" and uc is None:
+            self.logger.warning(
+                "undetected-chromedriver not installed; falling back to JS patches"
+            )
+            stealth = "patches"
+
+        options = uc.ChromeOptions() if stealth == "undetected" else Options()
         if self.headless:
             options.add_argument("--headless=new")
         options.add_argument("--no-sandbox")
@@ -150,24 +471,52 @@ class DolapScraper:
         options.add_argument("--disable-extensions")
         options.add_argument(f"--window-size=1920,1080")
 
+        profile = self._acquire_profile()
+        if profile is not None:
+            options.add_argument(f"--user-data-dir={profile.resolve()}")
+
         # Random User-Agent
         ua = random.choice(_USER_AGENTS)
         options.add_argument(f"--user-agent={ua}")
 
-        # Suppress automation flags
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option("useAutomationExtension", False)
+        if stealth != "undetected":
+            # Suppress automation flags (undetected-chromedriver does this
+            # itself and rejects these options)
+            options.add_experimental_option("excludeSwitches", ["enable-automation"])
+            options.add_experimental_option("useAutomationExtension", False)
 
-        self.driver = webdriver.Chrome(options=options)
+        options.page_load_strategy = self._page_load_strategy
 
-        # Remove webdriver flag from navigator
+        try:
+            if stealth == "undetected":
+                self.driver = uc.Chrome(options=options, headless=self.headless)
+            else:
+                self.driver = webdriver.Chrome(options=options)
+        except Exception:
+            self._release_profile()
+            raise
+
+        # Patch navigator fingerprints before any page script runs
         self.driver.execute_cdp_cmd(
             "Page.addScriptToEvaluateOnNewDocument",
-            {"source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"},
+            {"source": _WEBDRIVER_PATCH_JS if stealth == "basic" else _STEALTH_PATCH_JS},
         )
 
-        self.driver.set_page_load_timeout(self._timeout)
-        self.logger.info("WebDriver initialised", user_agent=ua[:60] + "…")
+        if self._blocked_url_patterns:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd(
+                "Network.setBlockedURLs", {"urls": self._blocked_url_patterns}
+            )
+
+        self.driver.set_page_load_timeout(self._page_load_timeout)
+        self.logger.info(
+            "WebDriver initialised",
+            user_agent=ua[:60] + "…",
+            page_load_strategy=self._page_load_strategy,
+            stealth=stealth,
+            profile=str(profile) if profile is not None else None,
+            blocked_patterns=len(self._blocked_url_patterns),
+        )
 
     def close(self) -> None:
         """Shut down the WebDriver."""
@@ -175,43 +524,114 @@ class DolapScraper:
             self.driver.quit()
             self.driver = None
             self.logger.info("WebDriver closed", stats=self._stats)
+        self._release_profile()
+
+    def _recycle_driver(self) -> None:
+        """Restart Chrome, carrying its cookies over to the new session.
+
+        Long sessions leak renderer and driver memory, so late pages of a
+        big batch get slower.  Cookies — including the Cloudflare clearance
+        cookie — are re-injected with CDP ``Network.setCookies``, which,
+        unlike ``add_cookie``, needs no page of the site to be loaded first.
+        """
+        if self.driver is None:
+            return
+        try:
+            cookies = self.driver.get_cookies()
+        except WebDriverException:
+            cookies = []
+        self.close()
+        self.start()
+        if cookies:
+            self.driver.execute_cdp_cmd(
+                "Network.setCookies", {"cookies": [_cdp_cookie(c) for c in cookies]}
+            )
+        self.logger.info("WebDriver recycled", cookies=len(cookies))
+
+    # -- browser profile --------------------------------------------------
+
+    def _acquire_profile(self) -> Path | None:
+        """Claim a free profile slot under ``profile_dir``.
+
+        Chrome refuses to share a user-data-dir between running browsers, so
+        concurrent scrapers — threads or processes — each take the first
+        slot (``profile_dir/0``, ``profile_dir/1``, …) whose ``.lock`` file
+        they can ``flock``.  The OS drops the lock if the process dies, so
+        crashed runs never leave slots stuck.  Returns ``None`` when
+        profiles are disabled or locking is unavailable.
+        """
+        if self._profile_root is None or fcntl is None:
+            return None
+        self._profile_root.mkdir(parents=True, exist_ok=True)
+        for slot in range(_MAX_PROFILE_SLOTS):
+            # The stack closes the file on every exit except a won lock,
+            # whose ownership moves to ``_profile_lock`` via ``pop_all``.
+            with ExitStack() as stack:
+                fh = stack.enter_context(open(self._profile_root / f"{slot}.lock", "a"))
+                try:
+                    fcntl.flock(fh, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    continue
+                self._profile_lock = stack.pop_all()
+                return self._profile_root / str(slot)
+        self.logger.warning("All Chrome profile slots busy; using a fresh profile")
+        return None
+
+    def _release_profile(self) -> None:
+        if self._profile_lock is not None:
+            self._profile_lock.close()  # closing the handle drops the flock
+            self._profile_lock = None
 
     # -- rate limiting ----------------------------------------------------
 
     def _sleep(self) -> None:
-        """Random sleep between requests."""
-        delay = random.uniform(self._delay_min, self._delay_max)
-        time.sleep(delay)
+        """Wait for the per-host rate limiter before the next request."""
+        self._limiter.acquire()
 
-    def _navigate(self, url: str, *, retries: int | None = None) -> str:
-        """Navigate to *url* with retry logic.  Returns page source HTML."""
+    def _navigate(
+        self,
+        url: str,
+        *,
+        retries: int | None = None,
+        fetch_source: bool = True,
+    ) -> str | None:
+        """Navigate to *url* with retry logic.  Returns page source HTML.
+
+        Callers that wait for more content and re-read the DOM afterwards
+        pass ``fetch_source=False`` to skip serialising it here (``None`` is
+        returned).
+        """
         assert self.driver is not None, "Call .start() first"
         max_tries = retries or self._max_retries
         full_url = url if url.startswith("http") else f"{_BASE_URL}{url}"
 
         for attempt in range(1, max_tries + 1):
             try:
-                self.driver.get(full_url)
+                try:
+                    self.driver.get(full_url)
+                except TimeoutException:
+                    # With "none" get() is not expected to finish loading;
+                    # the content waits below decide whether the page is usable.
+                    if self._page_load_strategy != "none":
+                        raise
                 # Wait for body to be present (Cloudflare may take a moment)
                 WebDriverWait(self.driver, self._timeout).until(
                     EC.presence_of_element_located((By.TAG_NAME, "body"))
                 )
-                self._stats["pages_loaded"] += 1
+                self._incr_stat("pages_loaded")
 
                 # Check for Cloudflare challenge page
-                page_source = self.driver.page_source
-                if "Attention Required" in page_source or "cf-error" in page_source:
+                if self._looks_like_cloudflare():
                     self.logger.warning(
                         "Cloudflare challenge detected, waiting…",
                         url=full_url,
                         attempt=attempt,
                     )
                     time.sleep(5 + attempt * 2)  # extra wait for CF
-                    page_source = self.driver.page_source
-                    if "Attention Required" in page_source:
+                    if self._page_has(_CF_BLOCK_MARKERS):
                         raise WebDriverException("Cloudflare block persists")
 
-                return page_source
+                return self._document_html() if fetch_source else None
 
             except (TimeoutException, WebDriverException) as exc:
                 self.logger.warning(
@@ -224,7 +644,7 @@ class DolapScraper:
                     backoff = self._backoff_factor ** attempt
                     time.sleep(backoff)
                 else:
-                    self._stats["errors"] += 1
+                    self._incr_stat("errors")
                     raise
 
         raise RuntimeError("Unreachable")  # pragma: no cover
@@ -268,7 +688,7 @@ class DolapScraper:
             self.logger.debug("Loading category page", url=url, page=page_num)
 
             try:
-                html = self._navigate(url)
+                self._navigate(url, fetch_source=False)
             except (TimeoutException, WebDriverException):
                 self.logger.error("Failed to load category page, stopping", page=page_num)
                 break
@@ -276,14 +696,15 @@ class DolapScraper:
             # Wait for product cards to render (JS)
             self._wait_for_products()
 
-            # Re-fetch page source after JS rendering
-            html = self.driver.page_source
+            # Re-fetch the rendered card area after JS rendering
+            html = self._inner_html(self._listing_container)
 
             # Extract product URLs
             urls = parse_listing_urls_from_page(html)
 
-            new_urls = [u for u in urls if u not in seen]
-            if not new_urls:
+            # Order-preserving dedup within the page, then against prior pages
+            fresh = [u for u in dict.fromkeys(urls) if u not in seen]
+            if not fresh:
                 self.logger.info(
                     "No new listings found, stopping pagination",
                     page=page_num,
@@ -291,14 +712,13 @@ class DolapScraper:
                 )
                 break
 
-            for u in new_urls:
-                seen.add(u)
-                all_urls.append(u)
+            seen.update(fresh)
+            all_urls.extend(fresh)
 
             self.logger.info(
                 "Category page scraped",
                 page=page_num,
-                new_urls=len(new_urls),
+                new_urls=len(fresh),
                 total=len(all_urls),
             )
             self._sleep()
@@ -316,25 +736,34 @@ class DolapScraper:
         try:
             # Product cards contain links to /urun/...
             WebDriverWait(self.driver, timeout).until(
-                lambda d: len(d.find_elements(By.CSS_SELECTOR, 'a[href*="/urun/"]')) > 0
+                lambda d: self._product_link_count() > 0
             )
         except TimeoutException:
             # Products may not have loaded (empty page or end of results)
             self.logger.debug("No product links found within timeout")
 
-        # Extra scroll to trigger lazy-loading
+        # Extra scroll to trigger lazy-loading, then wait only as long as it
+        # takes for new cards to show up (instead of a flat 2.5 s)
         try:
+            before = self._product_link_count()
             self.driver.execute_script(
                 "window.scrollTo(0, document.body.scrollHeight);"
             )
-            time.sleep(1.5)
+            with suppress(TimeoutException):  # timeout → nothing more to lazy-load
+                WebDriverWait(self.driver, _LAZY_LOAD_TIMEOUT, poll_frequency=0.1).until(
+                    lambda d: self._product_link_count() > before
+                )
             self.driver.execute_script(
                 "window.scrollTo(0, document.body.scrollHeight / 2);"
             )
-            time.sleep(1.0)
         except WebDriverException:
             pass
 
+    def _product_link_count(self) -> int:
+        """Number of ``/urun/`` links in the DOM (counted in the browser)."""
+        assert self.driver is not None
+        return int(self.driver.execute_script(_PRODUCT_LINK_COUNT_JS) or 0)
+
     # -- listing scraping -------------------------------------------------
 
     def scrape_listing(self, url: str) -> dict[str, Any]:
@@ -350,11 +779,27 @@ class DolapScraper:
         dict
             Parsed listing data.  See ``parsers.parse_product_detail``.
         """
+        fetched = self._fetch_listing(url)
+        if isinstance(fetched, dict):
+            return fetched
+        return self._finish_listing(url, fetched)
+
+    def _fetch_listing(self, url: str) -> _Page | dict[str, Any]:
+        """Browser half of ``scrape_listing``.
+
+        Returns the rendered page, or the final record when navigation
+        failed (nothing left to parse).
+        """
         self.logger.debug("Scraping listing", url=url)
+        cached = self._cache_get(url)
+        if cached is not None:
+            self._incr_stat("cache_hits")
+            return cached
+
         self._sleep()
 
         try:
-            html = self._navigate(url)
+            self._navigate(url, fetch_source=False)
         except (TimeoutException, WebDriverException) as exc:
             self.logger.error("Failed to load listing", url=url, error=str(exc)[:120])
             return {
@@ -364,14 +809,67 @@ class DolapScraper:
             }
 
         # Wait for price or brand text to appear (product content loaded)
-        self._wait_for_product_detail()
+        ready = self._wait_for_product_detail()
+
+        # Re-fetch HTML after full render; only fully rendered pages are
+        # cached, so a timed-out render or challenge page is retried next run
+        page = _Page(self._inner_html(self._detail_container), datetime.utcnow())
+        if ready:
+            self._cache_put(url, page)
+        return page
+
+    # -- HTML cache ---------------------------------------------------------
 
-        # Re-fetch HTML after full render
-        html = self.driver.page_source
+    def _cache_path(self, url: str) -> Path:
+        full_url = url if url.startswith("http") else f"{_BASE_URL}{url}"
+        digest = hashlib.sha1(full_url.encode("utf-8")).hexdigest()
+        return self._cache_dir / f"{digest}.html.gz"
 
-        data = parse_product_detail(html, url)
-        data["scraped_at"] = datetime.utcnow().isoformat()
-        self._stats["listings_scraped"] += 1
+    def _cache_get(self, url: str) -> _Page | None:
+        """Return the cached page for *url*, or ``None`` if stale/absent.
+
+        The file's mtime is the original fetch time (see ``_cache_put``).
+        """
+        if not self._cache_enabled:
+            return None
+        path = self._cache_path(url)
+        try:
+            mtime = path.stat().st_mtime
+            if time.time() - mtime > self._cache_ttl:
+                return None
+            with gzip.open(path, "rb") as fh:
+                html = fh.read().decode("utf-8")
+        except (OSError, EOFError, UnicodeDecodeError):
+            return None
+        fetched_at = datetime.fromtimestamp(mtime, timezone.utc).replace(tzinfo=None)
+        return _Page(html, fetched_at)
+
+    def _cache_put(self, url: str, page: _Page) -> None:
+        """Store a rendered page for *url* (atomic rename; failures are ignored).
+
+        The file's mtime is set to ``page.fetched_at``, which both the TTL
+        and the replayed ``scraped_at`` are derived from.
+        """
+        if not self._cache_enabled:
+            return
+        path = self._cache_path(url)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with gzip.open(tmp, "wb", compresslevel=3) as fh:
+                fh.write(page.html.encode("utf-8"))
+            ts = page.fetched_at.replace(tzinfo=timezone.utc).timestamp()
+            os.utime(tmp, (ts, ts))
+            os.replace(tmp, path)
+        except OSError as exc:
+            self.logger.debug("HTML cache write failed", url=url, error=str(exc)[:120])
+            tmp.unlink(missing_ok=True)
+
+    def _finish_listing(self, url: str, page: _Page) -> dict[str, Any]:
+        """Parse a rendered detail page and record it in the stats."""
+        data = parse_product_detail(page.html, url)
+        data["scraped_at"] = page.fetched_at.isoformat()
+        self._incr_stat("listings_scraped")
 
         if data.get("_parse_errors"):
             self.logger.warning(
@@ -382,15 +880,81 @@ class DolapScraper:
 
         return data
 
-    def _wait_for_product_detail(self, timeout: int = 10) -> None:
-        """Wait for product detail content to render."""
+    def _wait_for_product_detail(self, timeout: int = 10) -> bool:
+        """Wait for product detail content to render.
+
+        Returns ``True`` once the ready markers appeared, ``False`` on
+        timeout (the page may be half-rendered or a challenge page).
+        """
         assert self.driver is not None
         try:
             WebDriverWait(self.driver, timeout).until(
-                lambda d: "TL" in d.page_source and "Beğeni" in d.page_source
+                lambda d: self._page_has(_DETAIL_READY_MARKERS, require_all=True)
             )
         except TimeoutException:
             self.logger.debug("Product detail content may not have loaded fully")
+            return False
+        return True
+
+    def _inner_html(self, css: str | None) -> str:
+        """Serialise only the subtree matching *css* (full page if unset/absent).
+
+        ``page_source`` ships the whole document over the WebDriver wire;
+        when the caller only needs one container, ``outerHTML`` of that node
+        is a fraction of the bytes.  Falls back to the whole document when
+        *css* is ``None`` or matches nothing, so a changed layout degrades to
+        the old behaviour instead of losing data.
+        """
+        assert self.driver is not None
+        if css:
+            html = self.driver.execute_script(_OUTER_HTML_JS, css)
+            if html:
+                return html
+        return self._document_html()
+
+    def _document_html(self) -> str:
+        """Serialise the whole document via CDP ``DOM.getOuterHTML``.
+
+        ChromeDriver builds ``page_source`` by running ``XMLSerializer`` in
+        the page, which re-walks the DOM in JavaScript; ``DOM.getOuterHTML``
+        is Blink's native serialiser.  ``depth=0`` keeps ``DOM.getDocument``
+        from shipping the node tree.  Falls back to ``page_source`` where
+        the CDP call is unavailable.
+        """
+        assert self.driver is not None
+        try:
+            root = self.driver.execute_cdp_cmd("DOM.getDocument", {"depth": 0})["root"]
+            return self.driver.execute_cdp_cmd(
+                "DOM.getOuterHTML", {"nodeId": root["nodeId"]}
+            )["outerHTML"]
+        except (WebDriverException, KeyError):
+            return self.driver.page_source
+
+    def _looks_like_cloudflare(self) -> bool:
+        """Cheap Cloudflare interstitial check for every navigation.
+
+        Challenge and block pages carry a telltale ``<title>`` ("Just a
+        moment...", "Attention Required! | Cloudflare", "dolap.com | 521: Web
+        server is down", …), so the title — a few bytes — screens the happy
+        path; only a suspicious title pays for the full-document marker scan.
+        """
+        assert self.driver is not None
+        title = self.driver.title or ""
+        if not (
+            any(marker in title for marker in _CF_TITLE_MARKERS)
+            or _CF_ERROR_TITLE.search(title)
+        ):
+            return False
+        return self._page_has(_CF_MARKERS)
+
+    def _page_has(self, markers: tuple[str, ...], *, require_all: bool = False) -> bool:
+        """Return True if any (or every) marker occurs in the live document.
+
+        Same result as ``marker in driver.page_source``, evaluated in the
+        browser so polling does not serialise the DOM over the wire.
+        """
+        assert self.driver is not None
+        return bool(self.driver.execute_script(_PAGE_HAS_JS, list(markers), require_all))
 
     # -- batch operations -------------------------------------------------
 
@@ -414,44 +978,312 @@ class DolapScraper:
             All scraped listing dicts.
         """
         results: list[dict[str, Any]] = []
+
+        # One handle for the whole batch, streamed to as records arrive
+        with _jsonl_writer(output_path) as write:
+            for data in self._iter_listings(urls):
+                results.append(data)
+                write(data)
+
+        return results
+
+    def scrape_listings_batch_parallel(
+        self,
+        urls: list[str],
+        n_workers: int | None = None,
+        output_path: str | Path | None = None,
+    ) -> list[dict[str, Any]]:
+        """Scrape listings with a pool of independent browsers.
+
+        Each worker thread borrows a ``DolapScraper`` (its own Chrome, its
+        own User-Agent, created from the same config) from a queue, so
+        page loads, Cloudflare waits and politeness delays of different
+        workers overlap.  Records are written to *output_path* from the
+        calling thread as they complete; the returned list follows the
+        order of *urls*.
+
+        Parameters
+        ----------
+        urls : list[str]
+            Product detail URLs.
+        n_workers : int, optional
+            Browsers to run; defaults to ``max_concurrency`` from config.
+            ``1`` falls back to :meth:`scrape_listings_batch`.
+        output_path : str | Path, optional
+            If provided, results are appended line-by-line to this JSONL file.
+
+        Returns
+        -------
+        list[dict]
+            All scraped listing dicts, in input order.
+        """
+        n_workers = min(n_workers or self.cfg.get("max_concurrency", 4), len(urls))
+        if n_workers <= 1:
+            return self.scrape_listings_batch(urls, output_path)
+
+        workers = [
+            DolapScraper(
+                self._config_path,
+                headless=self.headless,
+                cache_enabled=self._cache_enabled,
+            )
+            for _ in range(n_workers)
+        ]
+        pool: queue.Queue[DolapScraper] = queue.Queue()
+        for worker in workers:
+            pool.put(worker)
+
+        def run(url: str) -> dict[str, Any]:
+            scraper = pool.get()
+            try:
+                scraper.start()  # no-op once the browser is up
+                return scraper.scrape_listing(url)
+            finally:
+                pool.put(scraper)
+
         total = len(urls)
+        results: list[dict[str, Any] | None] = [None] * total
+        self.logger.info("Starting parallel batch scrape", total=total, workers=n_workers)
+        try:
+            with (
+                _jsonl_writer(output_path) as write,
+                ThreadPoolExecutor(max_workers=n_workers) as executor,
+            ):
+                futures = {executor.submit(run, url): i for i, url in enumerate(urls)}
+                for done, future in enumerate(as_completed(futures), 1):
+                    data = future.result()
+                    results[futures[future]] = data
+                    write(data)
+                    if done % 10 == 0:
+                        self.logger.info(
+                            "Batch progress",
+                            done=done,
+                            total=total,
+                            errors=sum(w._stats["errors"] for w in workers),
+                        )
+        finally:
+            for worker in workers:
+                worker.close()
+                for key, value in worker.stats.items():
+                    self._incr_stat(key, value)
 
-        if output_path:
-            out = Path(output_path)
-            out.parent.mkdir(parents=True, exist_ok=True)
-        else:
-            out = None
+        self.logger.info(
+            "Batch scrape complete",
+            total=total,
+            scraped=total,
+            errors=self._stats["errors"],
+        )
+        return results  # type: ignore[return-value]
 
-        self.logger.info("Starting batch scrape", total=total)
+    def scrape_listings_batch_tabs(
+        self,
+        urls: list[str],
+        tabs: int = 3,
+        output_path: str | Path | None = None,
+    ) -> list[dict[str, Any]]:
+        """Scrape listings in *tabs* tabs of this scraper's single browser.
+
+        A cheaper rung than :meth:`scrape_listings_batch_parallel`: the tabs
+        share one Chrome process and its Cloudflare cookies.  Navigation is
+        started with ``window.location`` (non-blocking) and the tabs are
+        polled round-robin for the same readiness signal as
+        ``_wait_for_product_detail`` — evaluated in the browser, so only a
+        boolean crosses the wire.  Request *starts* are paced by the shared
+        per-host rate limiter rather than a delay added to each page's load
+        time, so the aggregate request rate matches the serial path while
+        load waits overlap.  Pages that do not become ready in time (or look like a
+        Cloudflare challenge) are retried through :meth:`scrape_listing`.
 
-        for idx, url in enumerate(urls, 1):
-            self.logger.info(f"[{idx}/{total}] Scraping", url=url[:80])
-            data = self.scrape_listing(url)
-            results.append(data)
+        Parameters
+        ----------
+        urls : list[str]
+            Product detail URLs.
+        tabs : int
+            Tabs to keep in flight.  ``1`` falls back to
+            :meth:`scrape_listings_batch`.
+        output_path : str | Path, optional
+            If provided, results are appended line-by-line to this JSONL file.
 
-            # Stream to JSONL
-            if out:
-                with open(out, "a", encoding="utf-8") as fh:
-                    # Remove _parse_errors from persisted data (keep it clean)
-                    record = {k: v for k, v in data.items() if k != "_parse_errors"}
-                    fh.write(json.dumps(record, ensure_ascii=False) + "\n")
+        Returns
+        -------
+        list[dict]
+            All scraped listing dicts, in input order.
+        """
+        tabs = min(tabs, len(urls))
+        if tabs <= 1:
+            return self.scrape_listings_batch(urls, output_path)
 
-            # Progress log every 10 listings
-            if idx % 10 == 0:
-                self.logger.info(
-                    "Batch progress",
-                    done=idx,
-                    total=total,
-                    errors=self._stats["errors"],
-                )
+        self.start()
+        assert self.driver is not None
+        driver = self.driver
+
+        main_handle = driver.current_window_handle
+        for _ in range(tabs - 1):
+            driver.execute_script("window.open('about:blank');")
+        handles = list(driver.window_handles)[:tabs]
+
+        total = len(urls)
+        pending = list(enumerate(urls))[::-1]  # pop() from the end → input order
+        in_flight: dict[str, tuple[int, str, float]] = {}
+        results: list[dict[str, Any] | None] = [None] * total
+        done = 0
+
+        self.logger.info("Starting tabbed batch scrape", total=total, tabs=tabs)
+        with _jsonl_writer(output_path) as write:
+
+            def record(idx: int, data: dict[str, Any]) -> None:
+                nonlocal done
+                results[idx] = data
+                write(data)
+                done += 1
+                if done % 10 == 0:
+                    self.logger.info(
+                        "Batch progress",
+                        done=done,
+                        total=total,
+                        errors=self._stats["errors"],
+                    )
+            try:
+                while pending or in_flight:
+                    now = time.monotonic()
+                    # Dispatch: start one navigation per free tab, as the limiter allows
+                    for handle in handles:
+                        if handle in in_flight or not pending:
+                            continue
+                        idx, url = pending[-1]
+                        cached = self._cache_get(url)
+                        if cached is not None:
+                            pending.pop()
+                            self._incr_stat("cache_hits")
+                            data = self._finish_listing(url, cached)
+                            record(idx, data)
+                            continue
+                        if not self._limiter.try_acquire():
+                            break  # no budget yet; poll the tabs meanwhile
+                        pending.pop()
+                        full_url = url if url.startswith("http") else f"{_BASE_URL}{url}"
+                        driver.switch_to.window(handle)
+                        driver.execute_script(_TAB_DISPATCH_JS, full_url)
+                        in_flight[handle] = (idx, url, now)
+
+                    # Poll: harvest every tab whose page is ready (or timed out)
+                    for handle, (idx, url, started) in list(in_flight.items()):
+                        driver.switch_to.window(handle)
+                        try:
+                            ready = driver.execute_script(
+                                _TAB_READY_JS, list(_DETAIL_READY_MARKERS)
+                            )
+                        except WebDriverException:
+                            ready = False  # mid-navigation; try again next round
+                        timed_out = time.monotonic() - started > self._timeout
+                        if not (ready or timed_out):
+                            continue
+
+                        del in_flight[handle]
+                        if timed_out or self._looks_like_cloudflare():
+                            # Slow or challenged page: full retry/backoff path
+                            data = self.scrape_listing(url)
+                        else:
+                            self._incr_stat("pages_loaded")
+                            page = _Page(
+                                self._inner_html(self._detail_container), datetime.utcnow()
+                            )
+                            self._cache_put(url, page)
+                            data = self._finish_listing(url, page)
+                        record(idx, data)
+
+                    if in_flight or pending:
+                        time.sleep(_TAB_POLL_INTERVAL)
+            finally:
+                for handle in handles:
+                    if handle != main_handle:
+                        driver.switch_to.window(handle)
+                        driver.close()
+                driver.switch_to.window(main_handle)
 
         self.logger.info(
             "Batch scrape complete",
             total=total,
-            scraped=len(results),
+            scraped=done,
+            errors=self._stats["errors"],
+        )
+        return results  # type: ignore[return-value]
+
+    def _iter_listings(self, urls: list[str]) -> Iterator[dict[str, Any]]:
+        """Yield scraped listing dicts one by one, logging batch progress.
+
+        Fetching and parsing are pipelined: a background thread drives the
+        browser (navigate, wait, politeness sleep) and hands rendered HTML
+        through a small bounded queue, while the consuming thread parses.
+        Parse time thus hides behind the next page load instead of adding
+        to it; one browser, no extra requests.  The browser is restarted
+        every ``recycle_driver_every`` pages to keep its memory bounded.
+        """
+        total = len(urls)
+        scraped = 0
+        fetched_q: queue.Queue[tuple[str, _Page | dict[str, Any]] | None] = queue.Queue(
+            maxsize=_FETCH_QUEUE_SIZE
+        )
+        stop = threading.Event()
+        failure: list[BaseException] = []
+
+        def put(item: tuple[str, _Page | dict[str, Any]] | None) -> None:
+            # Bounded put that gives up once the consumer has gone away
+            while not stop.is_set():
+                try:
+                    fetched_q.put(item, timeout=0.5)
+                    return
+                except queue.Full:
+                    continue
+
+        def produce() -> None:
+            try:
+                for idx, url in enumerate(urls, 1):
+                    if stop.is_set():
+                        return
+                    if self._recycle_every and idx > 1 and (idx - 1) % self._recycle_every == 0:
+                        self._recycle_driver()
+                    self.logger.info(f"[{idx}/{total}] Scraping", url=url[:80])
+                    put((url, self._fetch_listing(url)))
+            except BaseException as exc:  # re-raised in the consumer
+                failure.append(exc)
+            finally:
+                put(None)
+
+        self.logger.info("Starting batch scrape", total=total)
+
+        producer = threading.Thread(target=produce, name="scraper-fetch", daemon=True)
+        producer.start()
+        try:
+            while (item := fetched_q.get()) is not None:
+                url, fetched = item
+                if isinstance(fetched, dict):
+                    yield fetched
+                else:
+                    yield self._finish_listing(url, fetched)
+                scraped += 1
+
+                # Progress log every 10 listings
+                if scraped % 10 == 0:
+                    self.logger.info(
+                        "Batch progress",
+                        done=scraped,
+                        total=total,
+                        errors=self._stats["errors"],
+                    )
+        finally:
+            stop.set()
+            producer.join()
+
+        if failure:
+            raise failure[0]
+
+        self.logger.info(
+            "Batch scrape complete",
+            total=total,
+            scraped=scraped,
             errors=self._stats["errors"],
         )
-        return results
 
     # -- full category pipeline -------------------------------------------
 
@@ -460,19 +1292,41 @@ class DolapScraper:
         category_slug: str,
         max_pages: int | None = None,
         output_path: str | Path | None = None,
-    ) -> list[dict[str, Any]]:
+    ) -> int:
         """End-to-end: crawl category → scrape all listings → save.
 
-        Convenience method combining ``crawl_category`` +
-        ``scrape_listings_batch``.
+        Unlike ``scrape_listings_batch`` the records are never collected in
+        memory: each listing is streamed to *output_path* (JSONL, appended)
+        as soon as it is parsed.
+
+        Returns
+        -------
+        int
+            Number of listings scraped.
         """
         urls = self.crawl_category(category_slug, max_pages=max_pages)
         if not urls:
             self.logger.warning("No URLs found for category", category=category_slug)
-            return []
-        return self.scrape_listings_batch(urls, output_path=output_path)
+            return 0
+
+        listings = self._iter_listings(urls)
+        if output_path is None:
+            return sum(1 for _ in listings)
+
+        count = 0
+        with _jsonl_writer(output_path) as write:
+            for data in listings:
+                write(data)
+                count += 1
+        return count
+
+    def _incr_stat(self, key: str, amount: int = 1) -> None:
+        """Thread-safe ``self._stats[key] += amount``."""
+        with self._stats_lock:
+            self._stats[key] += amount
 
     @property
     def stats(self) -> dict[str, int]:
         """Return scraping statistics."""
-        return dict(self._stats)
+        with self._stats_lock:
+            return dict(self._stats)
@@ -2,11 +2,35 @@
 
 from src.utils.seed import set_global_seed
 from src.utils.experiment import create_experiment, save_metadata, get_git_commit_hash
+from src.utils.config import load_config
 from src.utils.config_snapshot import snapshot_configs
-from src.utils.data_version import compute_dataset_hash, compute_file_hash
-from src.utils.split import temporal_train_val_test_split
-from src.utils.metrics import compute_classification_metrics, save_metrics
-from src.utils.logger import setup_logging, get_logger, reset_logging
+from src.utils.data_version import (
+    compute_dataset_hash,
+    compute_dataset_hash_cached,
+    compute_dataset_hash_parallel,
+    compute_file_hash,
+)
+from src.utils.logger import setup_logging, get_logger, get_logger_lazy, reset_logging
+
+# pandas / numba-backed helpers are resolved on first access so that light
+# consumers (CLI ``--help``, loggers, config loading) skip their import cost.
+_LAZY_ATTRS = {
+    "temporal_train_val_test_split": "src.utils.split",
+    "compute_classification_metrics": "src.utils.metrics",
+    "save_metrics": "src.utils.metrics",
+    "load_metrics": "src.utils.metrics",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRS:
+        import importlib
+
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     # Seed
@@ -15,18 +39,24 @@ __all__ = [
     "create_experiment",
     "save_metadata",
     "get_git_commit_hash",
+    # Config
+    "load_config",
     # Config snapshot
     "snapshot_configs",
     # Data versioning
     "compute_dataset_hash",
+    "compute_dataset_hash_cached",
+    "compute_dataset_hash_parallel",
     "compute_file_hash",
     # Temporal split
     "temporal_train_val_test_split",
     # Metrics
     "compute_classification_metrics",
     "save_metrics",
+    "load_metrics",
     # Logging
     "setup_logging",
     "get_logger",
+    "get_logger_lazy",
     "reset_logging",
 ]
@@ -0,0 +1,70 @@
+"""
+YAML config loader.
+
+Parses configuration files with libyaml's C loader when PyYAML was built
+against it (pure-Python ``SafeLoader`` otherwise) and memoises the result
+per ``(path, mtime_ns)``, so repeated loads within one process — every
+``DolapScraper`` instance, each pipeline stage — cost a single ``stat()``.
+Editing the file changes its mtime and transparently invalidates the entry.
+
+The returned dict is shared between callers and must be treated as
+read-only; pass ``copy=True`` to get a private deep copy to mutate.
+
+Usage:
+    from src.utils.config import load_config
+
+    model_cfg = load_config("configs/model.yaml")
+"""
+
+from __future__ import annotations
+
+import copy as _copy
+import functools
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # pragma: no cover — PyYAML built without libyaml
+    from yaml import SafeLoader as _Loader  # type: ignore[assignment]
+
+
+# ── Public API ──────────────────────────────────────────────────────────────
+
+
+def load_config(path: str | Path, *, copy: bool = False) -> dict[str, Any]:
+    """Load a YAML file and return its contents as a dict.
+
+    Parameters
+    ----------
+    path : str | Path
+        YAML file to load.
+    copy : bool
+        Return a deep copy of the cached dict instead of the shared object.
+        Default ``False``.
+
+    Returns
+    -------
+    dict[str, Any]
+        Parsed file contents (empty dict for an empty file).
+    """
+    path = Path(path).resolve()
+    cfg = _load_config_cached(str(path), path.stat().st_mtime_ns)
+    return _copy.deepcopy(cfg) if copy else cfg
+
+
+def clear_config_cache() -> None:
+    """Drop every memoised config (mainly useful in tests)."""
+    _load_config_cached.cache_clear()
+
+
+# ── Private helpers ─────────────────────────────────────────────────────────
+
+
+@functools.lru_cache(maxsize=32)
+def _load_config_cached(path: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse *path*; *mtime_ns* is only part of the cache key."""
+    with open(path, encoding="utf-8") as fh:
+        return yaml.load(fh, Loader=_Loader) or {}
@@ -12,6 +12,7 @@ Usage:
 
 from __future__ import annotations
 
+import os
 import shutil
 from pathlib import Path
 
@@ -27,6 +28,7 @@ def snapshot_configs(
     exp_dir: str | Path,
     configs_dir: str | Path = DEFAULT_CONFIGS_DIR,
     glob_pattern: str = "*.yaml",
+    hardlink: bool = False,
 ) -> list[Path]:
     """Copy every config file matching *glob_pattern* into ``<exp_dir>/configs/``.
 
@@ -38,6 +40,14 @@ def snapshot_configs(
         Source directory that contains the YAML files.
     glob_pattern : str
         Glob pattern to match config files. Default ``"*.yaml"``.
+    hardlink : bool
+        Hard-link files instead of copying them (one inode operation each,
+        no extra disk space); falls back to a copy across filesystems or
+        where links are unsupported.  A link shares its content with the
+        source, so an *in-place* edit of a config later also changes the
+        snapshot — only enable it when configs are replaced atomically
+        (most editors, ``git checkout``) rather than rewritten.
+        Default ``False``.
 
     Returns
     -------
@@ -51,22 +61,33 @@ def snapshot_configs(
 
     copied: list[Path] = []
 
-    for src in sorted(configs_dir.glob(glob_pattern)):
+    # One walk covers root-level and nested files (e.g. configs/overrides/*.yaml);
+    # root-level files still come first, as before.
+    matches = (
+        (src, src.relative_to(configs_dir)) for src in configs_dir.rglob(glob_pattern)
+    )
+    for src, relative in sorted(matches, key=lambda m: (len(m[1].parts) > 1, m[0])):
         if not src.is_file():
             continue
-        dst = dest_dir / src.name
-        shutil.copy2(src, dst)
+        dst = dest_dir / relative
+        if len(relative.parts) > 1:
+            dst.parent.mkdir(parents=True, exist_ok=True)
+        _place(src, dst, hardlink)
         copied.append(dst)
 
-    # Also capture any nested YAML files (e.g. configs/overrides/*.yaml)
-    for src in sorted(configs_dir.rglob(glob_pattern)):
-        relative = src.relative_to(configs_dir)
-        # Skip root-level files already handled above
-        if relative.parent == Path("."):
-            continue
-        nested_dst = dest_dir / relative
-        nested_dst.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(src, nested_dst)
-        copied.append(nested_dst)
-
     return copied
+
+
+# ── Private helpers ─────────────────────────────────────────────────────────
+
+
+def _place(src: Path, dst: Path, hardlink: bool) -> None:
+    """Copy *src* to *dst* (metadata included), or hard-link it if asked."""
+    if hardlink:
+        try:
+            dst.unlink(missing_ok=True)  # ``os.link`` will not overwrite
+            os.link(src, dst)
+            return
+        except OSError:
+            pass  # cross-device, unsupported FS, … → regular copy
+    shutil.copy2(src, dst)
@@ -13,17 +13,32 @@ Usage:
 
     h = compute_dataset_hash("data/processed", glob_pattern="*.parquet")
     # hash only parquet files
+
+    h = compute_dataset_hash_cached("data/processed", glob_pattern="*.parquet")
+    # same digest, but re-runs on unchanged files only stat() them
+
+    h = compute_dataset_hash_parallel("data/processed", glob_pattern="*.parquet")
+    # per-file digests computed concurrently (a different, Merkle-style digest)
 """
 
 from __future__ import annotations
 
 import hashlib
+import json
+import os
+import stat
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
 # ── Constants ───────────────────────────────────────────────────────────────
 
-_CHUNK_SIZE = 8 * 1024 * 1024  # 8 MiB read chunks
+_CHUNK_SIZE = 8 * 1024 * 1024  # 8 MiB read chunks (pre-3.11 fallback)
+_HAS_FILE_DIGEST = sys.version_info >= (3, 11)
+
+DEFAULT_HASH_CACHE = Path.home() / ".cache" / "dolap" / "hash_cache.json"
+_HASH_CACHE_MAX_ENTRIES = 256
 
 
 # ── Public API ──────────────────────────────────────────────────────────────
@@ -85,13 +100,130 @@ def compute_dataset_hash(
         rel = filepath.relative_to(data_dir)
         hasher.update(str(rel).encode("utf-8"))
 
-        # Stream file content in chunks for memory efficiency
-        with open(filepath, "rb") as fh:
-            while True:
-                chunk = fh.read(_CHUNK_SIZE)
-                if not chunk:
-                    break
-                hasher.update(chunk)
+        # Stream file content into the same rolling hash
+        _update_from_file(hasher, filepath)
+
+    return hasher.hexdigest()
+
+
+def compute_dataset_hash_cached(
+    data_dir: str | Path,
+    glob_pattern: str = "*",
+    algorithm: str = "sha256",
+    cache_path: str | Path = DEFAULT_HASH_CACHE,
+) -> str:
+    """Memoised :func:`compute_dataset_hash` keyed on file metadata.
+
+    The cache key is a BLAKE2b digest of every matched file's
+    ``(relative path, size, mtime_ns)`` — O(num_files) ``stat`` calls
+    instead of reading every byte.  On a miss the content hash is computed
+    as usual and stored in the JSON cache at *cache_path*.
+
+    Parameters
+    ----------
+    data_dir, glob_pattern, algorithm
+        Forwarded to :func:`compute_dataset_hash`.
+    cache_path : str | Path
+        JSON file holding ``fingerprint → content hash`` entries.
+        Default ``~/.cache/dolap/hash_cache.json``.
+
+    Returns
+    -------
+    str
+        Hex digest, identical to :func:`compute_dataset_hash`.
+    """
+    data_dir = Path(data_dir)
+
+    if not data_dir.exists():
+        raise FileNotFoundError(f"Data directory not found: {data_dir}")
+
+    fingerprint = []
+    for f in sorted(data_dir.rglob(glob_pattern)):
+        try:
+            st = f.stat()
+        except OSError:
+            continue  # broken symlink — ``is_file()`` skips it in the full hash too
+        if stat.S_ISREG(st.st_mode):
+            fingerprint.append((str(f.relative_to(data_dir)), st.st_size, st.st_mtime_ns))
+
+    fp_key = hashlib.blake2b(
+        repr((str(data_dir.resolve()), glob_pattern, algorithm, fingerprint)).encode("utf-8"),
+        digest_size=16,
+    ).hexdigest()
+
+    cache_path = Path(cache_path)
+    cache = _read_hash_cache(cache_path)
+    if fp_key in cache:
+        return cache[fp_key]
+
+    digest = compute_dataset_hash(data_dir, glob_pattern=glob_pattern, algorithm=algorithm)
+
+    cache[fp_key] = digest
+    _write_hash_cache(cache_path, cache)
+    return digest
+
+
+def compute_dataset_hash_parallel(
+    data_dir: str | Path,
+    glob_pattern: str = "*",
+    algorithm: str = "sha256",
+    max_workers: int | None = None,
+) -> str:
+    """Hash every file in *data_dir* concurrently and combine the digests.
+
+    :func:`compute_dataset_hash` streams all bytes through one rolling hash,
+    which is inherently serial.  Here each file is digested independently
+    and the result is the hash of the ``(relative path, file digest)``
+    pairs in sorted path order — a two-level (Merkle-style) fingerprint
+    that is deterministic and independent of *max_workers*, but **not**
+    equal to :func:`compute_dataset_hash` for the same files.
+
+    Threads are enough for real parallelism: ``hashlib`` releases the GIL
+    while digesting large buffers and file reads release it too, so there
+    is no process start-up or pickling cost.
+
+    Parameters
+    ----------
+    data_dir, glob_pattern, algorithm
+        As for :func:`compute_dataset_hash`.
+    max_workers : int | None
+        Hashing threads; ``None`` → ``os.cpu_count()``.
+
+    Returns
+    -------
+    str
+        Hex digest of the combined hash.
+
+    Raises
+    ------
+    FileNotFoundError
+        If *data_dir* does not exist.
+    ValueError
+        If no files match the pattern.
+    """
+    data_dir = Path(data_dir)
+
+    if not data_dir.exists():
+        raise FileNotFoundError(f"Data directory not found: {data_dir}")
+
+    files = sorted(
+        f for f in data_dir.rglob(glob_pattern) if f.is_file()
+    )
+
+    if not files:
+        raise ValueError(
+            f"No files matching '{glob_pattern}' found in {data_dir}"
+        )
+
+    workers = min(max_workers or os.cpu_count() or 1, len(files))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        digests = executor.map(lambda f: _file_digest(f, algorithm), files)
+
+        hasher = hashlib.new(algorithm)
+        # ``map`` yields in submission order → sorted by relative path
+        for filepath, digest in zip(files, digests, strict=True):
+            hasher.update(str(filepath.relative_to(data_dir)).encode("utf-8"))
+            hasher.update(digest)
 
     return hasher.hexdigest()
 
@@ -117,11 +249,55 @@ def compute_file_hash(
     filepath = Path(filepath)
     hasher = hashlib.new(algorithm)
 
+    _update_from_file(hasher, filepath)
+    return hasher.hexdigest()
+
+
+# ── Private helpers ─────────────────────────────────────────────────────────
+
+
+def _update_from_file(hasher: hashlib._Hash, filepath: Path) -> None:
+    """Feed the bytes of *filepath* into *hasher*.
+
+    On Python 3.11+ ``hashlib.file_digest`` does the read loop in C with a
+    reused buffer (no per-chunk ``bytes`` objects).  Handing it a factory
+    that returns *hasher* keeps a single rolling hash, so digests are
+    byte-for-byte the same as the chunked loop used on older versions.
+    """
     with open(filepath, "rb") as fh:
+        if _HAS_FILE_DIGEST:
+            hashlib.file_digest(fh, lambda: hasher)
+            return
         while True:
             chunk = fh.read(_CHUNK_SIZE)
             if not chunk:
                 break
             hasher.update(chunk)
 
-    return hasher.hexdigest()
+
+def _file_digest(filepath: Path, algorithm: str) -> bytes:
+    """Raw digest of one file (worker for :func:`compute_dataset_hash_parallel`)."""
+    hasher = hashlib.new(algorithm)
+    _update_from_file(hasher, filepath)
+    return hasher.digest()
+
+
+def _read_hash_cache(path: Path) -> dict[str, str]:
+    """Load the fingerprint cache; a missing or corrupt file is an empty cache."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_hash_cache(path: Path, cache: dict[str, str]) -> None:
+    """Persist the cache, keeping only the newest entries, via atomic rename."""
+    entries = list(cache.items())[-_HASH_CACHE_MAX_ENTRIES:]
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(dict(entries), indent=2) + "\n", encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass  # caching is best-effort — the digest is still returned
@@ -19,13 +19,20 @@ Usage:
 
 from __future__ import annotations
 
+import functools
 import json
+import os
 import subprocess
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover — optional speed-up
+    orjson = None
+
 
 # ── Constants ───────────────────────────────────────────────────────────────
 
@@ -123,7 +130,8 @@ def save_metadata(
 
     existing: dict[str, Any] = {}
     if meta_path.exists():
-        existing = json.loads(meta_path.read_text(encoding="utf-8"))
+        raw = meta_path.read_bytes()
+        existing = _loads_json(raw)
 
     existing.update(extra)
     _write_json(meta_path, existing)
@@ -143,6 +151,17 @@ def get_git_commit_hash(short: bool = False) -> str:
     str
         Commit SHA or ``"unknown"`` if git is unavailable / not a repo.
     """
+    # HEAD cannot move under a running experiment, so one ``git`` call per
+    # (working directory, format) is enough for the whole process.
+    return _git_commit_hash_cached(os.getcwd(), short)
+
+
+# ── Private helpers ─────────────────────────────────────────────────────────
+
+
+@functools.lru_cache(maxsize=8)
+def _git_commit_hash_cached(cwd: str, short: bool) -> str:
+    """Run ``git rev-parse [--short] HEAD`` in *cwd* (memoised)."""
     cmd = ["git", "rev-parse"]
     if short:
         cmd.append("--short")
@@ -154,6 +173,7 @@ def get_git_commit_hash(short: bool = False) -> str:
             capture_output=True,
             text=True,
             timeout=5,
+            cwd=cwd,
         )
         if result.returncode == 0:
             return result.stdout.strip()
@@ -163,12 +183,48 @@ def get_git_commit_hash(short: bool = False) -> str:
     return "unknown"
 
 
-# ── Private helpers ─────────────────────────────────────────────────────────
+def _loads_json(raw: bytes) -> Any:
+    """Parse JSON with orjson, falling back to the stdlib for ``NaN`` tokens.
+
+    Files written by the stdlib encoder (older runs, installs without
+    orjson) may contain ``NaN`` / ``Infinity``, which orjson rejects.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
 
 
 def _write_json(path: Path, data: dict[str, Any]) -> None:
-    """Atomically write *data* as pretty-printed JSON."""
-    path.write_text(
-        json.dumps(data, indent=2, ensure_ascii=False, default=str) + "\n",
-        encoding="utf-8",
-    )
+    """Atomically write *data* as pretty-printed JSON.
+
+    The payload goes to a sibling temp file that is then ``os.replace``-d
+    over *path*, so readers never see a half-written file.  With
+    :pypi:`orjson` installed serialisation runs in Rust and numpy scalars
+    / arrays are written as numbers; datetimes and other unknown types
+    still fall back to ``str`` exactly like the stdlib path (NaN becomes
+    ``null`` rather than the non-standard ``NaN`` token).
+    """
+    if orjson is not None:
+        payload = orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_INDENT_2
+            | orjson.OPT_SERIALIZE_NUMPY
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_APPEND_NEWLINE,
+        )
+    else:
+        payload = (
+            json.dumps(data, indent=2, ensure_ascii=False, default=str) + "\n"
+        ).encode("utf-8")
+
+    tmp = path.with_suffix(path.suffix + f".{os.getpid()}.tmp")
+    try:
+        tmp.write_bytes(payload)
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
@@ -10,10 +10,14 @@ Usage:
 
     logger = get_logger("train", experiment_id="exp_20260301_143022")
     logger.info("Training started", model="xgboost", n_samples=12345)
+
+    debug = get_logger_lazy("train")   # arguments are callables, run on demand
+    debug.debug("Split sizes: {}", lambda: expensive_summary())
 """
 
 from __future__ import annotations
 
+import functools
 import sys
 from pathlib import Path
 from typing import Any
@@ -29,6 +33,10 @@ _EXPERIMENT_ID: str | None = None
 
 # ── Constants ───────────────────────────────────────────────────────────────
 
+# Kept as plain strings on purpose: loguru parses a string format once, in
+# ``add()``, and each record then costs a single ``str.format_map``.  A
+# callable ``format=`` is re-parsed for markup on every distinct string it
+# returns, so pre-rendering records in a callable would be slower.
 _DEFAULT_FORMAT = (
     "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
     "<level>{level:<8}</level> | "
@@ -55,6 +63,7 @@ def setup_logging(
     rotation: str = "10 MB",
     retention: str = "30 days",
     experiment_id: str | None = None,
+    enqueue: bool = True,
 ) -> None:
     """Configure the global loguru logger (idempotent).
 
@@ -73,6 +82,11 @@ def setup_logging(
         Loguru retention spec (e.g. ``"30 days"``).
     experiment_id : str, optional
         Experiment identifier injected into every log record.
+    enqueue : bool
+        Hand file records to loguru's background writer instead of writing
+        them in the calling thread, so hot loops never block on disk I/O.
+        Queued records are drained by :func:`reset_logging` (and by
+        loguru's own exit hook).  Default ``True``.
     """
     global _CONFIGURED, _EXPERIMENT_ID  # noqa: PLW0603
 
@@ -103,6 +117,8 @@ def setup_logging(
             rotation=rotation,
             retention=retention,
             encoding="utf-8",
+            enqueue=enqueue,
+            catch=True,  # a failing write is reported, never raised into the caller
         )
 
     # Patch default extras so format strings never KeyError
@@ -132,31 +148,69 @@ def get_logger(
     Returns
     -------
     loguru.Logger
-        A bound logger instance.
+        A bound logger instance, shared by every call with the same context
+        (cleared by :func:`reset_logging`).
     """
     # Ensure base logging is configured (safe to call multiple times)
     if not _CONFIGURED:
         setup_logging(experiment_id=experiment_id)
 
-    ctx: dict[str, Any] = {
-        "module_name": module_name,
-    }
+    if experiment_id is None:
+        experiment_id = _EXPERIMENT_ID or "no_experiment"
+
+    items = tuple(sorted(extra.items()))
+    try:
+        return _bind_cached(module_name, experiment_id, items)
+    except TypeError:  # unhashable extra value — bind without caching
+        return _loguru_logger.bind(
+            module_name=module_name, experiment_id=experiment_id, **extra
+        )
+
+
+def get_logger_lazy(
+    module_name: str,
+    experiment_id: str | None = None,
+    **extra: Any,
+) -> Any:
+    """Like :func:`get_logger`, but message arguments are evaluated lazily.
 
-    if experiment_id is not None:
-        ctx["experiment_id"] = experiment_id
-    elif _EXPERIMENT_ID is not None:
-        ctx["experiment_id"] = _EXPERIMENT_ID
-    else:
-        ctx["experiment_id"] = "no_experiment"
+    Every positional / keyword argument of a logging call must be a
+    zero-argument callable; it is only invoked when the record passes the
+    level filter, so DEBUG instrumentation costs nothing while DEBUG is off::
 
-    ctx.update(extra)
+        logger = get_logger_lazy("train")
+        logger.debug("importances: {}", lambda: model.feature_importances_.tolist())
 
-    return _loguru_logger.bind(**ctx)
+    Plain values are **not** accepted (loguru would try to call them) —
+    use :func:`get_logger` for ordinary logging.
+    """
+    return get_logger(module_name, experiment_id, **extra).opt(lazy=True)
 
 
 def reset_logging() -> None:
-    """Reset the logging state — mainly useful for tests."""
+    """Reset the logging state — mainly useful for tests.
+
+    Also call it at shutdown when a file handler was enqueued: ``remove()``
+    waits for the background writer to drain its queue.
+    """
     global _CONFIGURED, _EXPERIMENT_ID  # noqa: PLW0603
     _loguru_logger.remove()
+    _bind_cached.cache_clear()
     _CONFIGURED = False
     _EXPERIMENT_ID = None
+
+
+# ── Private helpers ─────────────────────────────────────────────────────────
+
+
+@functools.lru_cache(maxsize=128)
+def _bind_cached(
+    module_name: str,
+    experiment_id: str,
+    extra: tuple[tuple[str, Any], ...],
+) -> Any:
+    """Bound logger per context, so repeated ``get_logger`` calls reuse it."""
+    return _loguru_logger.bind(
+        module_name=module_name, experiment_id=experiment_id, **dict(extra)
+    )
+
@@ -2,23 +2,71 @@
 Metrics persistence for experiment tracking.
 
 Computes standard classification metrics and persists them as JSON
-inside the experiment directory so that every run is auditable.
+inside the experiment directory so that every run is auditable.  Large
+numpy arrays in the payload (per-row probabilities, SHAP vectors, …) are
+stored as binary sidecar files next to the JSON instead of as lists.
 
 Usage:
     from src.utils.metrics import save_metrics, compute_classification_metrics
 
     metrics = compute_classification_metrics(y_true, y_pred, y_prob)
     save_metrics(exp_dir, metrics, model_name="xgboost")
+    metrics = load_metrics(exp_dir / "metrics" / "xgboost_metrics.json")
 """
 
 from __future__ import annotations
 
+import contextlib
 import json
+import math
+import re
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 import numpy as np
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover — optional speed-up
+    orjson = None
+
+try:
+    import bloscpack as bp
+except ImportError:  # pragma: no cover — optional; ``.npy`` sidecars otherwise
+    bp = None
+
+from src.utils.metrics_numba import (
+    NUMBA_AVAILABLE,
+    average_precision_fast,
+    roc_auc_fast,
+)
+
+
+# ── Constants ───────────────────────────────────────────────────────────────
+
+# Arrays with at least this many elements go to a sidecar file; smaller
+# ones (confusion matrices, a handful of thresholds) stay inline in the JSON.
+_SIDECAR_MIN_SIZE = 1024
+_SIDECAR_KEY = "__array__"  # marks a sidecar reference in the JSON payload
+
+_HAS_BITWISE_COUNT = hasattr(np, "bitwise_count")  # NumPy ≥ 2.0
+
+
+# ``_json_default`` handlers keyed on the exact type: one dict lookup per
+# value instead of an ``isinstance`` MRO walk per candidate class.
+_JSON_DEFAULTS: dict[type, Any] = {
+    t: int if issubclass(t, np.integer) else float
+    for t in set(np.sctypeDict.values())
+    if issubclass(t, (np.integer, np.floating))
+}
+_JSON_DEFAULTS[np.bool_] = bool
+_JSON_DEFAULTS[np.ndarray] = np.ndarray.tolist
+
+
+# ── Module-level state ──────────────────────────────────────────────────────
+
+_MKDIR_CACHE: set[Path] = set()  # metrics dirs already created this process
+
 
 # ── Public API ──────────────────────────────────────────────────────────────
 
@@ -45,35 +93,27 @@ def compute_classification_metrics(
     dict[str, float]
         Metric name → value mapping.
     """
-    from sklearn.metrics import (
-        accuracy_score,
-        average_precision_score,
-        f1_score,
-        precision_score,
-        recall_score,
-        roc_auc_score,
-    )
+    # One confusion matrix instead of four sklearn calls that each
+    # re-validate and re-scan both arrays
+    yt = np.asarray(y_true)
+    yp = np.asarray(y_pred)
+    n = yt.size
+    tp, n_true, n_pred = _label_counts(yt, yp)
+    fp = n_pred - tp
+    fn = n_true - tp
+    tn = n - tp - fp - fn
 
     metrics: dict[str, float] = {
-        "accuracy": float(accuracy_score(y_true, y_pred)),
-        "precision": float(precision_score(y_true, y_pred, zero_division=0)),
-        "recall": float(recall_score(y_true, y_pred, zero_division=0)),
-        "f1": float(f1_score(y_true, y_pred, zero_division=0)),
+        "accuracy": (tp + tn) / n if n else 0.0,
+        "precision": tp / (tp + fp) if tp + fp else 0.0,
+        "recall": tp / (tp + fn) if tp + fn else 0.0,
+        "f1": 2 * tp / (2 * tp + fp + fn) if tp + fp + fn else 0.0,
     }
 
     if y_prob is not None:
-        try:
-            metrics["roc_auc"] = float(roc_auc_score(y_true, y_prob))
-        except ValueError:
-            # Only one class present in y_true — AUC is undefined
-            metrics["roc_auc"] = float("nan")
-
-        try:
-            metrics["average_precision"] = float(
-                average_precision_score(y_true, y_prob)
-            )
-        except ValueError:
-            metrics["average_precision"] = float("nan")
+        metrics["roc_auc"], metrics["average_precision"] = _ranking_metrics(
+            y_true, y_prob
+        )
 
     return metrics
 
@@ -83,6 +123,7 @@ def save_metrics(
     metrics: dict[str, Any],
     model_name: str = "model",
     filename: str | None = None,
+    pretty: bool = False,
 ) -> Path:
     """Persist *metrics* as JSON inside ``<exp_dir>/metrics/``.
 
@@ -97,38 +138,257 @@ def save_metrics(
     filename : str, optional
         Override the output filename. If ``None``, defaults to
         ``<model_name>_metrics.json``.
+    pretty : bool
+        Indent the JSON by two spaces.  Default ``False`` — compact output,
+        since the files are read by tooling; view one with
+        ``python -m json.tool <file>``.
 
     Returns
     -------
     Path
         Absolute path to the written metrics file.
+
+    Notes
+    -----
+    Serialised with :pypi:`orjson` when installed, with the stdlib ``json``
+    otherwise.  Either way undefined metrics such as a single-class ROC-AUC
+    (``NaN`` / ``±inf``) are written as ``null`` — never the non-standard
+    ``NaN`` token — so both writers produce the same documents.
+
+    Numeric arrays of 1024 elements or more (at any depth
+    of nested dicts) are written to ``<stem>.<key path>.blp`` — zstd,
+    byte-shuffled, via :pypi:`bloscpack` when installed — or ``.npy``
+    otherwise, and replaced in the JSON by
+    ``{"__array__": <file name>, "dtype": …, "shape": […]}``.
+    :func:`load_metrics` restores them.
     """
     exp_dir = Path(exp_dir)
     metrics_dir = exp_dir / "metrics"
-    metrics_dir.mkdir(parents=True, exist_ok=True)
+    if metrics_dir not in _MKDIR_CACHE:
+        metrics_dir.mkdir(parents=True, exist_ok=True)
+        _MKDIR_CACHE.add(metrics_dir)
 
     if filename is None:
         filename = f"{model_name}_metrics.json"
 
     out_path = metrics_dir / filename
+    metrics = _write_sidecars(metrics, out_path)
 
-    out_path.write_text(
-        json.dumps(metrics, indent=2, ensure_ascii=False, default=_json_default)
-        + "\n",
-        encoding="utf-8",
-    )
+    if orjson is not None:
+        # Rust encoder; numpy scalars / arrays are serialised natively, so
+        # ``_json_default`` only sees the rare odd type (``Path``, …).  The
+        # payload is already UTF-8 bytes and goes to the file in one
+        # unbuffered write — no text-encode pass, no second copy.
+        payload = orjson.dumps(
+            metrics,
+            default=_json_default,
+            option=(orjson.OPT_INDENT_2 if pretty else 0)
+            | orjson.OPT_SERIALIZE_NUMPY
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_APPEND_NEWLINE,
+        )
+        with open(out_path, "wb", buffering=0) as fh:
+            view = memoryview(payload)
+            while view:
+                view = view[fh.write(view) :]  # raw writes may be partial
+    else:
+        # Stream the encoder's chunks instead of building the whole
+        # document as ``str`` and then again as encoded ``bytes``
+        with open(out_path, "w", encoding="utf-8") as fh:
+            json.dump(
+                _nan_to_null(metrics),
+                fh,
+                indent=2 if pretty else None,
+                separators=None if pretty else (",", ":"),
+                ensure_ascii=False,
+                default=lambda obj: _nan_to_null(_json_default(obj)),
+            )
+            fh.write("\n")
     return out_path
 
 
+def load_metrics(path: str | Path) -> dict[str, Any]:
+    """Read a file written by :func:`save_metrics`, restoring sidecar arrays.
+
+    Parameters
+    ----------
+    path : str | Path
+        The ``*_metrics.json`` file.
+
+    Returns
+    -------
+    dict
+        The metrics payload, with sidecar references replaced by arrays.
+    """
+    path = Path(path)
+    raw = path.read_bytes()
+    metrics = None
+    if orjson is not None:
+        # Files from older stdlib-encoded runs may hold ``NaN`` tokens
+        with contextlib.suppress(orjson.JSONDecodeError):
+            metrics = orjson.loads(raw)
+    if metrics is None:
+        metrics = json.loads(raw)
+    return _read_sidecars(metrics, path.parent)
+
+
 # ── Private helpers ─────────────────────────────────────────────────────────
 
 
+def _label_counts(yt: np.ndarray, yp: np.ndarray) -> tuple[int, int, int]:
+    """Return ``(true positives, actual positives, predicted positives)``.
+
+    Boolean inputs are counted as they are (``count_nonzero`` on ``bool``
+    is already a vectorised popcount).  Anything else has to be turned
+    into a mask first anyway, so the masks are packed to bits straight
+    away: the AND and the three popcounts then run over 1/8 of the bytes.
+    """
+    if (yt.dtype == np.bool_ and yp.dtype == np.bool_) or not _HAS_BITWISE_COUNT:
+        mt = yt if yt.dtype == np.bool_ else yt != 0
+        mp = yp if yp.dtype == np.bool_ else yp != 0
+        return (
+            int(np.count_nonzero(mt & mp)),
+            int(np.count_nonzero(mt)),
+            int(np.count_nonzero(mp)),
+        )
+
+    # Zero padding in the last byte never adds to a count
+    bits_t = np.packbits(yt if yt.dtype == np.bool_ else yt != 0)
+    bits_p = np.packbits(yp if yp.dtype == np.bool_ else yp != 0)
+    return tuple(  # type: ignore[return-value]
+        int(np.bitwise_count(bits).sum(dtype=np.int64))
+        for bits in (bits_t & bits_p, bits_t, bits_p)
+    )
+
+
+class _SklearnMetrics(NamedTuple):
+    roc_auc_score: Any
+    average_precision_score: Any
+
+
+_SKLEARN: _SklearnMetrics | None = None
+
+
+def _sklearn() -> _SklearnMetrics:
+    """Import the sklearn fallbacks once; later calls are a global read.
+
+    Kept out of module scope so the Numba path never pays sklearn's
+    import time.
+    """
+    global _SKLEARN  # noqa: PLW0603
+
+    if _SKLEARN is None:
+        from sklearn.metrics import average_precision_score, roc_auc_score
+
+        _SKLEARN = _SklearnMetrics(roc_auc_score, average_precision_score)
+    return _SKLEARN
+
+
+def _ranking_metrics(y_true: Any, y_prob: Any) -> tuple[float, float]:
+    """Return ``(roc_auc, average_precision)``; ``nan`` when undefined.
+
+    Uses the Numba kernels from :mod:`src.utils.metrics_numba` when numba is
+    installed, otherwise (or on unexpected input types) scikit-learn.
+    """
+    if NUMBA_AVAILABLE:
+        try:
+            yt = np.asarray(y_true, dtype=np.int8)
+            ys = np.asarray(y_prob, dtype=np.float64)
+            if np.isnan(ys).any():
+                # Undefined, as on the sklearn path (which raises ValueError)
+                return float("nan"), float("nan")
+            return float(roc_auc_fast(yt, ys)), float(average_precision_fast(yt, ys))
+        except TypeError:
+            pass  # degrade gracefully to the sklearn implementation
+
+    sk = _sklearn()
+
+    try:
+        roc_auc = float(sk.roc_auc_score(y_true, y_prob))
+    except ValueError:
+        # Only one class present in y_true — AUC is undefined
+        roc_auc = float("nan")
+
+    try:
+        average_precision = float(sk.average_precision_score(y_true, y_prob))
+    except ValueError:
+        average_precision = float("nan")
+
+    return roc_auc, average_precision
+
+
+def _write_sidecars(
+    metrics: dict[str, Any],
+    out_path: Path,
+    prefix: str = "",
+) -> dict[str, Any]:
+    """Return *metrics* with large arrays written out and replaced by references."""
+    out: dict[str, Any] = {}
+    for key, value in metrics.items():
+        key_path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            value = _write_sidecars(value, out_path, f"{key_path}.")
+        elif (
+            isinstance(value, np.ndarray)
+            and value.size >= _SIDECAR_MIN_SIZE
+            and not value.dtype.hasobject
+        ):
+            name = re.sub(r"[^\w.-]", "_", f"{out_path.stem}.{key_path}")
+            if bp is not None:
+                name += ".blp"
+                bp.pack_ndarray_to_file(
+                    np.ascontiguousarray(value),
+                    str(out_path.parent / name),
+                    blosc_args=bp.BloscArgs(cname="zstd", clevel=3, shuffle=True),
+                )
+            else:
+                name += ".npy"
+                np.save(out_path.parent / name, value, allow_pickle=False)
+            value = {
+                _SIDECAR_KEY: name,
+                "dtype": value.dtype.str,
+                "shape": list(value.shape),
+            }
+        out[key] = value
+    return out
+
+
+def _read_sidecars(metrics: dict[str, Any], directory: Path) -> dict[str, Any]:
+    """Inverse of :func:`_write_sidecars`."""
+    out: dict[str, Any] = {}
+    for key, value in metrics.items():
+        if isinstance(value, dict):
+            if _SIDECAR_KEY in value:
+                file = directory / value[_SIDECAR_KEY]
+                if file.suffix == ".blp":
+                    if bp is None:
+                        raise ImportError(f"bloscpack is required to read {file}")
+                    value = bp.unpack_ndarray_from_file(str(file))
+                else:
+                    value = np.load(file, allow_pickle=False)
+            else:
+                value = _read_sidecars(value, directory)
+        out[key] = value
+    return out
+
+
+def _nan_to_null(obj: Any) -> Any:
+    """Replace non-finite floats with ``None``, matching orjson's output."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _nan_to_null(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_nan_to_null(value) for value in obj]
+    return obj
+
+
 def _json_default(obj: Any) -> Any:
     """Handle non-serialisable types that commonly appear in metrics."""
-    if isinstance(obj, (np.integer,)):
-        return int(obj)
-    if isinstance(obj, (np.floating,)):
-        return float(obj)
-    if isinstance(obj, np.ndarray):
+    handler = _JSON_DEFAULTS.get(type(obj))
+    if handler is not None:
+        return handler(obj)
+    if isinstance(obj, np.ndarray):  # subclasses (``np.memmap``, …)
         return obj.tolist()
     return str(obj)
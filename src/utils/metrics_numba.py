@@ -0,0 +1,162 @@
+"""
+Numba-compiled ranking metrics.
+
+Linear-pass (after one sort) implementations of the score-based metrics
+used by :func:`src.utils.metrics.compute_classification_metrics`, JIT
+compiled with :pypi:`numba` when it is installed.  Compiled kernels are
+cached on disk (``~/.numba_cache`` unless ``NUMBA_CACHE_DIR`` is set) so
+only the very first process pays the compilation cost.
+
+Usage:
+    from src.utils.metrics_numba import NUMBA_AVAILABLE, roc_auc_fast
+
+    if NUMBA_AVAILABLE:
+        auc = roc_auc_fast(y_true.astype(np.int8), y_prob.astype(np.float64))
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import numpy as np
+
+# Must be set before numba is imported; an explicit ``$NUMBA_CACHE_DIR`` wins.
+NUMBA_CACHE_DIR = os.environ.setdefault("NUMBA_CACHE_DIR", str(Path.home() / ".numba_cache"))
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover — numba is optional
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        """No-op stand-in so the kernels stay importable without numba."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+# ``nnan``/``ninf`` are left out: the kernels return NaN for undefined metrics.
+_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+
+# ── Public API ──────────────────────────────────────────────────────────────
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def roc_auc_fast(y_true: np.ndarray, y_score: np.ndarray) -> float:
+    """ROC-AUC via the Mann–Whitney statistic (ties count one half).
+
+    Returns ``nan`` when *y_true* contains a single class.
+    """
+    order = np.argsort(-y_score)
+    n = order.shape[0]
+    n_pos = 0.0
+    area = 0.0
+    i = 0
+    while i < n:
+        # One group of tied scores
+        # (Always consumes at least one element, so NaN scores — never
+        # equal to themselves — cannot stall the loop.)
+        tp_g = 0.0
+        fp_g = 0.0
+        s = y_score[order[i]]
+        while True:
+            if y_true[order[i]] != 0:
+                tp_g += 1.0
+            else:
+                fp_g += 1.0
+            i += 1
+            if i >= n or y_score[order[i]] != s:
+                break
+        area += fp_g * (n_pos + 0.5 * tp_g)
+        n_pos += tp_g
+    n_neg = n - n_pos
+    if n_pos == 0.0 or n_neg == 0.0:
+        return np.nan
+    return area / (n_pos * n_neg)
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def pr_curve_fast(
+    y_true: np.ndarray,
+    y_score: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Precision / recall at every distinct score threshold (descending).
+
+    Returns ``(precision, recall, thresholds)``; recall is all-``nan`` when
+    there are no positives.
+    """
+    order = np.argsort(-y_score)
+    n = order.shape[0]
+    precision = np.empty(n, dtype=np.float64)
+    recall = np.empty(n, dtype=np.float64)
+    thresholds = np.empty(n, dtype=np.float64)
+
+    n_pos = 0.0
+    for i in range(n):
+        if y_true[i] != 0:
+            n_pos += 1.0
+
+    tp = 0.0
+    fp = 0.0
+    k = 0
+    i = 0
+    while i < n:
+        s = y_score[order[i]]
+        while True:  # at least one element per group (see ``roc_auc_fast``)
+            if y_true[order[i]] != 0:
+                tp += 1.0
+            else:
+                fp += 1.0
+            i += 1
+            if i >= n or y_score[order[i]] != s:
+                break
+        precision[k] = tp / (tp + fp)
+        recall[k] = tp / n_pos if n_pos > 0.0 else np.nan
+        thresholds[k] = s
+        k += 1
+    return precision[:k], recall[:k], thresholds[:k]
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def average_precision_fast(y_true: np.ndarray, y_score: np.ndarray) -> float:
+    """Step-wise average precision, ``Σ (Rₙ − Rₙ₋₁) · Pₙ`` (sklearn definition).
+
+    Returns ``nan`` when *y_true* has no positives.
+    """
+    n_pos = 0
+    for i in range(y_true.shape[0]):
+        if y_true[i] != 0:
+            n_pos += 1
+    if n_pos == 0:
+        return np.nan
+    precision, recall, _ = pr_curve_fast(y_true, y_score)
+    ap = 0.0
+    prev_recall = 0.0
+    for k in range(precision.shape[0]):
+        ap += (recall[k] - prev_recall) * precision[k]
+        prev_recall = recall[k]
+    return ap
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def best_f1_threshold(y_true: np.ndarray, y_score: np.ndarray) -> tuple[float, float]:
+    """Return ``(threshold, f1)`` maximising F1 over all score thresholds.
+
+    Predicting positive for ``score >= threshold`` reaches the returned F1.
+    """
+    precision, recall, thresholds = pr_curve_fast(y_true, y_score)
+    best_f1 = 0.0
+    best_t = np.inf
+    for k in range(precision.shape[0]):
+        p = precision[k]
+        r = recall[k]
+        if p + r > 0.0:
+            f1 = 2.0 * p * r / (p + r)
+            if f1 > best_f1:
+                best_f1 = f1
+                best_t = thresholds[k]
+    return best_t, best_f1
@@ -23,10 +23,9 @@ def set_global_seed(seed: int = 42) -> None:
     Covers
     ------
     - :mod:`random` (Python stdlib)
-    - :mod:`numpy`
+    - :mod:`numpy` (legacy global state)
     - :mod:`sklearn` (via numpy — sklearn has no independent RNG)
-    - :mod:`xgboost` (via ``PYTHONHASHSEED`` and numpy seed)
-    - Hash-based operations (``PYTHONHASHSEED``)
+    - :mod:`xgboost` (via numpy seed; pass ``random_state`` explicitly)
 
     Parameters
     ----------
@@ -35,28 +34,34 @@ def set_global_seed(seed: int = 42) -> None:
 
     Notes
     -----
-    ``PYTHONHASHSEED`` is set as an environment variable.  For it to take
-    full effect on hash randomisation, the interpreter should be started
-    **after** the variable is exported.  Within a running process the
-    variable is honoured by ``dict`` / ``set`` ordering only from Python
-    3.3+ when set before interpreter start.  Setting it here is still
-    useful because XGBoost and other C-level libraries read it at runtime.
+    Hash randomisation is fixed when the interpreter starts, so for *this*
+    process ``PYTHONHASHSEED`` only counts when exported before launch
+    (``PYTHONHASHSEED=42 python -m …``); a mismatch is logged at debug
+    level only, as it is the normal case.  The value is still written to
+    the environment so that child interpreters (joblib/loky workers) start
+    pinned.  Model libraries (XGBoost, LightGBM, CatBoost) take their seed
+    from the estimator's ``random_state`` / ``random_seed`` parameter.
     """
     # Python stdlib
     random.seed(seed)
 
-    # Hash seed — affects dict ordering & XGBoost internal hashing
-    os.environ["PYTHONHASHSEED"] = str(seed)
+    # Hash seed — only honoured when exported before interpreter start.
+    # Once written below it matches, so repeat calls stay quiet.
+    if os.environ.get("PYTHONHASHSEED") != str(seed):
+        from src.utils.logger import get_logger
+
+        get_logger("seed").debug(
+            "PYTHONHASHSEED not exported as {0}; this process keeps a random "
+            "hash seed (export PYTHONHASHSEED={0} to pin it)",
+            seed,
+        )
+    os.environ["PYTHONHASHSEED"] = str(seed)  # inherited by worker processes
 
     # NumPy
     try:
         import numpy as np
 
-        np.random.seed(seed)
-
-        # NumPy ≥ 1.17 Generator API (used by newer sklearn)
-        # We don't replace the default_rng singleton, but libraries that
-        # accept a `random_state` int will use this seed value.
+        np.random.seed(seed)  # legacy global RandomState
     except ImportError:
         warnings.warn(
             "numpy not installed — skipping numpy seed.",
@@ -67,9 +72,9 @@ def set_global_seed(seed: int = 42) -> None:
     # scikit-learn relies entirely on numpy's RNG when you pass
     # `random_state=seed` as an int, so the numpy seed above covers it.
 
-    # XGBoost — reads PYTHONHASHSEED; also respects numpy seed for
-    # data shuffling.  The `seed` / `random_state` param in the estimator
-    # constructor should still be set explicitly in model config.
+    # XGBoost — respects the numpy seed for data shuffling.  The `seed` /
+    # `random_state` param in the estimator constructor should still be set
+    # explicitly in model config.
 
     # LightGBM — same story: numpy seed + `random_state` param.
 
@@ -87,3 +92,4 @@ def set_global_seed(seed: int = 42) -> None:
             torch.backends.cudnn.benchmark = False
     except ImportError:
         pass  # torch not required
+
@@ -17,15 +17,21 @@ Usage:
     train_df = splits["train"]
     val_df   = splits["val"]
     test_df  = splits["test"]
+
+When the frame is too large to materialise up front, compute the split on
+the timestamps alone and gather each segment's rows afterwards:
+
+    positions = temporal_split_positions(times, test_size=0.15, val_size=0.15)
+    train_rows = positions["train"]   # row indices, oldest first
 """
 
 from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
-
 # ── Public API ──────────────────────────────────────────────────────────────
 
 
@@ -34,17 +40,26 @@ def temporal_train_val_test_split(
     time_col: str = "listed_at",
     test_size: float = 0.15,
     val_size: float = 0.15,
+    return_indices: bool = False,
+    preserve_order: bool = False,
+    reset_index: bool = False,
 ) -> dict[str, Any]:
     """Split a DataFrame chronologically — **no random shuffle**.
 
-    The data is sorted by *time_col* and sliced into three contiguous
-    segments so that:
+    The rows are divided into three chronological segments so that:
 
     .. code-block:: text
 
         |<──── train ────>|<── val ──>|<── test ──>|
         oldest            cutoff_1    cutoff_2    newest
 
+    The two cutoffs are found with ``np.partition`` (O(N)) on the time
+    column alone and each segment is selected with a boolean mask, so the
+    frame is never sorted or copied as a whole.  Segment membership is
+    exactly that of a stable sort — rows tied on a cutoff timestamp are
+    assigned in storage order — but rows inside a segment keep their
+    original order and index labels unless *preserve_order* is set.
+
     Parameters
     ----------
     df : pd.DataFrame
@@ -56,13 +71,29 @@ def temporal_train_val_test_split(
     val_size : float
         Fraction of data reserved for the **validation** set
         (between train and test).
+    return_indices : bool
+        Return row positions instead of materialised frames, plus the
+        (datetime-typed) frame itself under ``frame``.  Callers can then
+        select columns before rows — ``frame[features].iloc[splits["train"]]``
+        — and never gather the columns a model does not use.
+        Default ``False``.
+    preserve_order : bool
+        Sort each segment chronologically (stable, so the result matches
+        slicing a stably sorted frame).  Only the segments are sorted,
+        never the whole frame.  Default ``False`` — storage order.
+    reset_index : bool
+        Give each segment a fresh ``0..n-1`` index instead of the labels
+        from *df*.  Ignored with *return_indices*.  Default ``False``.
 
     Returns
     -------
     dict
-        ``train``        – training DataFrame
-        ``val``          – validation DataFrame
-        ``test``         – test DataFrame
+        ``train``        – training DataFrame (``int64`` positions with
+        *return_indices*)
+        ``val``          – validation DataFrame (ditto)
+        ``test``         – test DataFrame (ditto)
+        ``frame``        – *df* with a datetime *time_col*; only with
+        *return_indices*
         ``cutoff_val``   – datetime boundary between train and val
         ``cutoff_test``  – datetime boundary between val and test
         ``split_sizes``  – ``{"train": N, "val": N, "test": N}``
@@ -79,6 +110,110 @@ def temporal_train_val_test_split(
             f"Available columns: {list(df.columns)}"
         )
 
+    _check_sizes(test_size, val_size)
+
+    # ── Ensure datetime type (only re-assigned when it had to be parsed) ─
+    col = _ensure_datetime(df[time_col])
+    if col is not df[time_col]:
+        df = df.assign(**{time_col: col})
+
+    n_train, n_val, n_test = _split_counts(len(df), test_size, val_size)
+
+    # ── Partition on the timestamps alone — NEVER shuffle ───────────────
+    # ``datetime64[ns]`` ordering is preserved for tz-aware columns (UTC)
+    ts = col.to_numpy(dtype="datetime64[ns]")
+    k_val, k_test = n_train - 1, n_train + n_val - 1
+    part = np.partition(ts, [k_val, k_test])
+    in_train, pos_val = _head_mask(ts, k_val, part[k_val])
+    in_head, pos_test = _head_mask(ts, k_test, part[k_test])
+
+    masks = {"train": in_train, "val": in_head & ~in_train, "test": ~in_head}
+    bounds = {
+        "cutoff_val": col.iloc[pos_val],
+        "cutoff_test": col.iloc[pos_test] if n_val else None,
+        "split_sizes": {"train": n_train, "val": n_val, "test": n_test},
+    }
+
+    positions = {name: np.flatnonzero(mask) for name, mask in masks.items()}
+    if preserve_order:
+        positions = {
+            name: pos[np.argsort(ts[pos], kind="stable")]
+            for name, pos in positions.items()
+        }
+    if return_indices:
+        return {**positions, "frame": df, **bounds}
+
+    # ── Slice ───────────────────────────────────────────────────────────
+    segments = {name: df.iloc[pos] for name, pos in positions.items()}
+    if reset_index:
+        segments = {name: seg.reset_index(drop=True) for name, seg in segments.items()}
+    return {**segments, **bounds}
+
+
+def temporal_split_positions(
+    times: Any,
+    test_size: float = 0.15,
+    val_size: float = 0.15,
+) -> dict[str, Any]:
+    """Chronological split computed from the timestamp column alone.
+
+    Same segment sizes and boundaries as
+    :func:`temporal_train_val_test_split`, but instead of slicing a frame it
+    returns the row positions of each segment.  This lets callers scan only
+    the time column first and then read each split's rows in batches,
+    without ever holding the full dataset in memory.  Rows with equal
+    timestamps keep their original relative order (stable sort).
+
+    Parameters
+    ----------
+    times : array-like
+        Timestamps, one per row, in storage order (datetime-parseable).
+    test_size : float
+        Fraction of rows reserved for the **test** set (newest rows).
+    val_size : float
+        Fraction of rows reserved for the **validation** set.
+
+    Returns
+    -------
+    dict
+        ``train`` / ``val`` / ``test`` – ``int64`` row positions, oldest first
+        ``cutoff_val``   – datetime boundary between train and val
+        ``cutoff_test``  – datetime boundary between val and test
+        ``split_sizes``  – ``{"train": N, "val": N, "test": N}``
+
+    Raises
+    ------
+    ValueError
+        If size fractions are invalid or there are too few rows.
+    """
+    _check_sizes(test_size, val_size)
+
+    col = _ensure_datetime(
+        times if isinstance(times, pd.Series) else pd.Series(times, copy=False)
+    )
+    ts = col.to_numpy(dtype="datetime64[ns]")
+    n_train, n_val, n_test = _split_counts(len(ts), test_size, val_size)
+
+    order = np.argsort(ts, kind="stable")
+    train_pos = order[:n_train]
+    val_pos = order[n_train : n_train + n_val]
+    test_pos = order[n_train + n_val :]
+
+    return {
+        "train": train_pos,
+        "val": val_pos,
+        "test": test_pos,
+        "cutoff_val": col.iloc[train_pos[-1]],
+        "cutoff_test": col.iloc[val_pos[-1]] if n_val else None,
+        "split_sizes": {"train": n_train, "val": n_val, "test": n_test},
+    }
+
+
+# ── Private helpers ─────────────────────────────────────────────────────────
+
+
+def _check_sizes(test_size: float, val_size: float) -> None:
+    """Validate the split fractions."""
     if not (0 < test_size < 1):
         raise ValueError(f"test_size must be in (0, 1), got {test_size}")
 
@@ -91,14 +226,40 @@ def temporal_train_val_test_split(
             f"got {test_size} + {val_size} = {test_size + val_size}"
         )
 
-    # ── Ensure datetime type ────────────────────────────────────────────
-    df = df.copy()
-    df[time_col] = pd.to_datetime(df[time_col])
 
-    # ── Sort chronologically — NEVER shuffle ────────────────────────────
-    df = df.sort_values(time_col).reset_index(drop=True)
+def _ensure_datetime(col: pd.Series) -> pd.Series:
+    """Return *col* itself when already ``datetime64`` (naive or tz-aware).
 
-    n = len(df)
+    Upstream ingestion writes real timestamps, so the common case costs a
+    dtype check instead of a full ``pd.to_datetime`` parse and a new
+    column allocation.
+    """
+    if pd.api.types.is_datetime64_any_dtype(col):
+        return col
+    return pd.to_datetime(col, errors="raise")
+
+
+def _head_mask(ts: np.ndarray, k: int, kth: np.datetime64) -> tuple[np.ndarray, int]:
+    """Mask of the first ``k + 1`` rows of a stable sort of *ts*.
+
+    *kth* is the ``k``-th smallest value (from ``np.partition``).  Rows
+    strictly before it are all in; of the rows equal to it, only the first
+    ones in storage order, as a stable sort would keep them.  ``NaT`` sorts
+    last.  Also returns the position of the last admitted row holding *kth*.
+    """
+    nat = np.isnat(ts)
+    if np.isnat(kth):
+        before, tied = ~nat, nat
+    else:
+        before, tied = ts < kth, ts == kth
+    tied_pos = np.flatnonzero(tied)[: k + 1 - int(np.count_nonzero(before))]
+    mask = before
+    mask[tied_pos] = True
+    return mask, int(tied_pos[-1])
+
+
+def _split_counts(n: int, test_size: float, val_size: float) -> tuple[int, int, int]:
+    """Return ``(n_train, n_val, n_test)`` for *n* rows."""
     n_test = int(n * test_size)
     n_val = int(n * val_size)
     n_train = n - n_val - n_test
@@ -108,26 +269,4 @@ def temporal_train_val_test_split(
             f"Not enough samples for training split: "
             f"n={n}, n_train={n_train}, n_val={n_val}, n_test={n_test}"
         )
-
-    # ── Slice ───────────────────────────────────────────────────────────
-    train_df = df.iloc[:n_train]
-    val_df = df.iloc[n_train : n_train + n_val]
-    test_df = df.iloc[n_train + n_val :]
-
-    cutoff_val = train_df[time_col].iloc[-1]
-    cutoff_test = val_df[time_col].iloc[-1]
-
-    split_sizes = {
-        "train": len(train_df),
-        "val": len(val_df),
-        "test": len(test_df),
-    }
-
-    return {
-        "train": train_df,
-        "val": val_df,
-        "test": test_df,
-        "cutoff_val": cutoff_val,
-        "cutoff_test": cutoff_test,
-        "split_sizes": split_sizes,
-    }
+    return n_train, n_val, n_test
@@ -0,0 +1,65 @@
+"""Tests for ``src.utils.metrics`` and the Numba ranking kernels."""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+from sklearn.metrics import average_precision_score, roc_auc_score
+
+import src.utils.metrics as metrics_mod
+from src.utils.metrics import compute_classification_metrics, load_metrics, save_metrics
+from src.utils.metrics_numba import average_precision_fast, pr_curve_fast, roc_auc_fast
+
+
+def test_nan_scores_give_nan_ranking_metrics() -> None:
+    y_true = np.array([0, 1, 1, 0])
+    y_pred = np.array([0, 1, 0, 0])
+    metrics = compute_classification_metrics(
+        y_true, y_pred, np.array([0.1, np.nan, 0.4, 0.3])
+    )
+    assert math.isnan(metrics["roc_auc"])
+    assert math.isnan(metrics["average_precision"])
+    assert metrics["accuracy"] == 0.75
+
+
+@pytest.mark.parametrize("kernel", [roc_auc_fast, pr_curve_fast, average_precision_fast])
+def test_kernels_terminate_on_nan_scores(kernel) -> None:
+    y_true = np.array([0, 1, 1, 0, 1], dtype=np.int8)
+    kernel(y_true, np.array([np.nan, 0.2, np.nan, np.nan, 0.9]))  # must not hang
+
+
+def test_kernels_match_sklearn_with_ties() -> None:
+    rng = np.random.default_rng(0)
+    for _ in range(100):
+        n = int(rng.integers(2, 50))
+        y_true = rng.integers(0, 2, n).astype(np.int8)
+        if y_true.min() == y_true.max():
+            continue
+        y_score = rng.integers(0, 5, n) / 4  # coarse scores → many ties
+        assert roc_auc_fast(y_true, y_score) == pytest.approx(roc_auc_score(y_true, y_score))
+        assert average_precision_fast(y_true, y_score) == pytest.approx(
+            average_precision_score(y_true, y_score)
+        )
+
+
+def test_stdlib_writer_matches_orjson_for_nan(tmp_path, monkeypatch) -> None:
+    payload = {
+        "roc_auc": float("nan"),
+        "f32": np.float32("nan"),
+        "curve": np.array([0.5, np.inf]),
+        "nested": {"values": [np.nan, 1.5]},
+    }
+    expected = {
+        "roc_auc": None,
+        "f32": None,
+        "curve": [0.5, None],
+        "nested": {"values": [None, 1.5]},
+    }
+    if metrics_mod.orjson is not None:
+        assert load_metrics(save_metrics(tmp_path, payload, model_name="fast")) == expected
+    monkeypatch.setattr(metrics_mod, "orjson", None)
+    path = save_metrics(tmp_path, payload, model_name="stdlib")
+    assert b"NaN" not in path.read_bytes()
+    assert load_metrics(path) == expected
@@ -0,0 +1,270 @@
+"""Parity tests for ``src.scraping.parsers``.
+
+The parse path (lxml when installed, strainers, fast paths) must yield the
+same records as the original implementation.  The expected values below
+were produced by that original parser (a full ``html.parser`` tree searched
+in place) and are pinned here, so the current code is never checked
+against itself.  They include its quirks (``size`` running into the like
+counter, …): these tests guard parity, not correctness.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import itertools
+import json
+
+import pytest
+
+from src.scraping.parsers import parse_listing_urls_from_page, parse_product_detail
+
+_URL = "https://dolap.com/urun/zara-bej-kazak-yeni-etiketli-user-442885461"
+
+# Page fragments, combined into full documents below.  Several put text
+# directly under <body> (or at fragment top level), outside any element.
+_PRICES = ("<span>1.299 TL</span><span>899 TL</span>", "899 TL", "<p>349TL</p>500 TL", "")
+_CONDITIONS = ("<div>Yeni ve Etiketli</div>", "Az Kullanılmış", "")
+_SIZES = ("<li>Beden: M</li>", "Beden : 38", "")
+_COUNTS = ("<span>32 Beğeni</span><a>Yorumlar (4)</a>", "5 Beğeni 12 Yorum", "")
+_SELLERS = (
+    "<div><a href='/profil/iphonelcase'>iphonelcase</a> (1221)</div>",
+    "<a href='/profil/ayse'>ayse</a> (87)",
+    "",
+)
+_EXTRAS = ("<div>Alıcı Ödemeli Kargo</div><p>Tertemiz kazak.</p>", "Ücretsiz Kargo Satıldı", "")
+
+# sha256 of the original parser's records for ``_pages()`` (see ``_digest``)
+_SWEEP_SHA256 = "99ccce9de37a07a0e8135517d372a5feaf1edc3a3aed4aff5782daf2049e44ca"
+
+# Fields shared by every pinned record below
+_COMMON = {
+    "url": _URL,
+    "listing_id": "442885461",
+    "category": None,
+    "subcategory": None,
+    "color": "Bej",
+    "photo_count": 0,
+}
+
+
+def _body(price: int, cond: int, size: int, counts: int, seller: int, extra: int) -> str:
+    return (
+        f"{_PRICES[price]}{_CONDITIONS[cond]}<ul>{_SIZES[size]}</ul>"
+        f"{_COUNTS[counts]}{_SELLERS[seller]}{_EXTRAS[extra]}"
+    )
+
+
+def _document(body: str) -> str:
+    return (
+        "<html><head><title>Zara Kazak - Dolap.com</title>"
+        "<script>var x = '999 TL';</script><style>.a{}</style></head>"
+        f"<body><h1>Zara</h1>{body}<script>window.y = 1;</script></body></html>"
+    )
+
+
+def _pages() -> list[str]:
+    pages = []
+    for combo in itertools.product(
+        *(range(len(part)) for part in (_PRICES, _CONDITIONS, _SIZES, _COUNTS, _SELLERS, _EXTRAS))
+    ):
+        body = _body(*combo)
+        pages.append(_document(body))
+        pages.append(body)  # bare fragment: everything at top level
+    return pages[::7]  # every 7th keeps the sample varied but quick
+
+
+def _digest(records: list[dict]) -> str:
+    payload = json.dumps(records, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+_BASELINE_CASES = [
+    pytest.param(
+        _document(_body(0, 0, 0, 0, 0, 0)),
+        {
+            "brand": "Zara",
+            "title": "Zara Kazak",
+            "price": 899.0,
+            "original_price": 1299.0,
+            "has_discount": True,
+            "condition": "Yeni ve Etiketli",
+            "size": "M32 Be",
+            "description_text": "Zara Kazak - Dolap.com",
+            "description_length": 22,
+            "description_word_count": 4,
+            "like_count": 32,
+            "comment_count": 4,
+            "shipping_info": "Alıcı Ödemeli Kargo",
+            "shipping_buyer_pays": True,
+            "seller_username": "iphonelcase",
+            "seller_listing_count": 1221,
+            "is_sold": False,
+            "_parse_errors": [],
+        },
+        id="document-tagged",
+    ),
+    pytest.param(
+        _body(1, 1, 1, 1, 1, 1),
+        {
+            "brand": None,
+            "title": None,
+            "price": 899.0,
+            "original_price": None,
+            "has_discount": False,
+            "condition": "Az Kullanılmış",
+            "size": "385 Be",
+            "description_text": "(87)Ücretsiz Kargo Satıldı",
+            "description_length": 26,
+            "description_word_count": 3,
+            "like_count": 385,
+            "comment_count": 12,
+            "shipping_info": "Ücretsiz Kargo",
+            "shipping_buyer_pays": False,
+            "seller_username": "ayse",
+            "seller_listing_count": 87,
+            "is_sold": True,
+            "_parse_errors": ["Missing key fields: ['brand']"],
+        },
+        id="fragment-loose-text",
+    ),
+    pytest.param(
+        _document(_body(2, 2, 1, 1, 0, 1)),
+        {
+            "brand": "Zara",
+            "title": "Zara Kazak",
+            "price": 349.0,
+            "original_price": None,
+            "has_discount": False,
+            "condition": None,
+            "size": "385 Be",
+            "description_text": "Zara Kazak - Dolap.com",
+            "description_length": 22,
+            "description_word_count": 4,
+            "like_count": 385,
+            "comment_count": 12,
+            "shipping_info": "Ücretsiz Kargo",
+            "shipping_buyer_pays": False,
+            "seller_username": "iphonelcase",
+            "seller_listing_count": 1221,
+            "is_sold": True,
+            "_parse_errors": ["Missing key fields: ['condition']"],
+        },
+        id="document-mixed",
+    ),
+    pytest.param(
+        _body(2, 0, 2, 2, 2, 2),
+        {
+            "brand": None,
+            "title": None,
+            "price": 349.0,
+            "original_price": None,
+            "has_discount": False,
+            "condition": "Yeni ve Etiketli",
+            "size": None,
+            "description_text": None,
+            "description_length": 0,
+            "description_word_count": 0,
+            "like_count": None,
+            "comment_count": None,
+            "shipping_info": None,
+            "shipping_buyer_pays": False,
+            "seller_username": None,
+            "seller_listing_count": None,
+            "is_sold": False,
+            "_parse_errors": ["Missing key fields: ['brand', 'seller_username']"],
+        },
+        id="fragment-sparse",
+    ),
+    pytest.param(
+        _document(_body(3, 1, 0, 0, 1, 0)),
+        {
+            "brand": "Zara",
+            "title": "Zara Kazak",
+            "price": None,
+            "original_price": None,
+            "has_discount": False,
+            "condition": "Az Kullanılmış",
+            "size": "M32 Be",
+            "description_text": "Zara Kazak - Dolap.com",
+            "description_length": 22,
+            "description_word_count": 4,
+            "like_count": 32,
+            "comment_count": 4,
+            "shipping_info": "Alıcı Ödemeli Kargo",
+            "shipping_buyer_pays": True,
+            "seller_username": "ayse",
+            "seller_listing_count": 4,
+            "is_sold": False,
+            "_parse_errors": ["Missing key fields: ['price']"],
+        },
+        id="document-no-price",
+    ),
+    pytest.param(
+        _body(0, 2, 1, 0, 2, 1),
+        {
+            "brand": None,
+            "title": None,
+            "price": 899.0,
+            "original_price": 1299.0,
+            "has_discount": True,
+            "condition": None,
+            "size": "3832 Be",
+            "description_text": "Ücretsiz Kargo Satıldı",
+            "description_length": 22,
+            "description_word_count": 3,
+            "like_count": 3832,
+            "comment_count": 4,
+            "shipping_info": "Ücretsiz Kargo",
+            "shipping_buyer_pays": False,
+            "seller_username": None,
+            "seller_listing_count": None,
+            "is_sold": True,
+            "_parse_errors": [
+                "Missing key fields: ['brand', 'condition', 'seller_username']"
+            ],
+        },
+        id="fragment-no-seller",
+    ),
+]
+
+
+@pytest.mark.parametrize(("html", "fields"), _BASELINE_CASES)
+def test_product_detail_matches_baseline(html: str, fields: dict) -> None:
+    expected = {**_COMMON, **fields}
+    assert parse_product_detail(html, _URL) == expected
+    assert parse_product_detail(html.encode("utf-8"), _URL) == expected
+
+
+def test_product_detail_sweep_matches_baseline_digest() -> None:
+    pages = _pages()
+    records = [parse_product_detail(html, _URL) for html in pages]
+    assert [parse_product_detail(html.encode("utf-8"), _URL) for html in pages] == records
+    assert _digest(records) == _SWEEP_SHA256
+
+
+def test_loose_body_text_is_kept() -> None:
+    html = (
+        "<html><body>Yeni ve Etiketli 899 TL Beden: M 12 Beğeni Satıldı"
+        "<a href='/profil/ayse'>ayse</a> (87)</body></html>"
+    )
+    record = parse_product_detail(html, _URL)
+    assert record["price"] == 899.0
+    assert record["condition"] == "Yeni ve Etiketli"
+    assert record["like_count"] == 12
+    assert record["seller_listing_count"] == 87
+    assert record["is_sold"] is True
+
+
+def test_listing_urls_match_baseline() -> None:
+    html = (
+        "<html><body>"
+        "<a href='/urun/zara-bej-kazak-100001'>a</a>"
+        "<a href='https://dolap.com/urun/mango-elbise-200002?ref=x#y'>b</a>"
+        "<a href='/urun/zara-bej-kazak-100001'>dup</a>"
+        "<a href='/profil/foo'>p</a><a>nohref</a>"
+        "</body></html>"
+    )
+    assert parse_listing_urls_from_page(html) == [
+        "/urun/zara-bej-kazak-100001",
+        "/urun/mango-elbise-200002",
+    ]